@@ -30,16 +30,26 @@ Usage
 .. code-block:: bash
 
    python app.py --port auto --dry-audio
+   python app.py --osc 57120 --quiet          # OSC only, nothing on stdout
    python app.py --demo --osc 57120
+   python app.py --osc 57120 --osc-batch 16   # drain bursts from fast firmware in one syscall
+   python app.py --osc 57120 --osc-batch 16 --osc-bundle   # ...as one OSC bundle packet
 """
 from __future__ import annotations
 
 import argparse
+import atexit
+import importlib
+import io
 import json
+import os
+import queue
+import selectors
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Dict, Iterator, Optional
+from typing import Any, Callable, Dict, Iterator, Optional
 
 # Make the repo root importable so ``roomlens`` is available when running
 # ``python host/python/app.py`` straight from a clone.
@@ -47,25 +57,83 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+# pyserial and python-osc are imported on first use (see ``_optional``) so
+# ``--help`` and ``--demo`` without OSC skip their import cost; python-osc
+# alone drags in asyncio. ``None`` means "tried, not installed".
+_NOT_LOADED: Any = object()
+serial: Any = _NOT_LOADED
+list_ports: Any = _NOT_LOADED
+udp_client: Any = _NOT_LOADED
 try:
-    import serial
-    import serial.tools.list_ports as list_ports
-except Exception:  # pragma: no cover - guard rails for classrooms without pyserial
-    serial = None  # type: ignore[assignment]
-    list_ports = None  # type: ignore[assignment]
-try:
-    from pythonosc import udp_client
-except Exception:  # pragma: no cover - allow OSC-less rehearsals
-    udp_client = None  # type: ignore[assignment]
-
-from roomlens import MappingPipeline, demo_frame, load_mapping
+    import orjson
+except Exception:  # pragma: no cover - stdlib json is plenty for demos
+    orjson = None  # type: ignore[assignment]
+
+# orjson parses raw bytes straight off the wire (no decode/strip round-trip)
+# and is several times quicker on the small frames the Teensy streams.
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:  # pragma: no cover - exercised only without orjson installed
+    # One shared decoder; json.loads would re-check its kwargs and sniff the
+    # byte encoding on every frame.
+    _JSON_DECODE = json.JSONDecoder().decode
+
+    def _loads(raw: bytes) -> Any:
+        return _JSON_DECODE(raw.decode("utf-8", errors="ignore"))
+
+    def _dumps(payload: Dict[str, object]) -> bytes:
+        # Compact separators, so output matches orjson byte for byte.
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+# Dry-audio lines are flushed in small batches rather than one write() per
+# frame. Everything pending is also flushed whenever the frame source is
+# about to wait (see ``on_idle``), so output never sits behind a quiet
+# sensor; the time bound, kept under the 40 ms demo interval, only matters
+# for streams that never pause.
+STDOUT_FLUSH_FRAMES = 32
+STDOUT_FLUSH_SECONDS = 0.02
+
+DEMO_FRAME_SECONDS = 0.04  # 25 Hz demo cadence
+
+# Repeated frames are not re-sent over OSC, but a synth that restarts while
+# the room is still would never hear anything again; resend at least this
+# often so it picks the current values back up.
+OSC_KEEPALIVE_SECONDS = 1.0
+
+# Frames buffered between the serial reader thread and the main loop.
+SERIAL_QUEUE_FRAMES = 64
+_SERIAL_EOF = object()
+
+from roomlens import MappingPipeline, OscBatcher, demo_frame, load_mapping
+from roomlens.mapping import yaml_loader
 
 
 # --------- Utility ---------
+def _optional(name: str, module: str) -> Any:
+    """Import ``module`` into global ``name`` on first use; ``None`` if missing.
+
+    Anything already stored in the global (including a test double) is
+    returned untouched.
+    """
+
+    value = globals()[name]
+    if value is _NOT_LOADED:
+        try:
+            value = importlib.import_module(module)
+        except Exception:  # pragma: no cover - guard rails for classrooms without extras
+            value = None
+        globals()[name] = value
+    return value
+
+
 def find_serial() -> Optional[str]:
     """Best-effort hunt for a Teensy board on the USB serial bus."""
 
-    if serial is None or list_ports is None:
+    if _optional("serial", "serial") is None:
+        return None
+    list_ports = _optional("list_ports", "serial.tools.list_ports")
+    if list_ports is None:
         return None
     ports = list(list_ports.comports())
     for p in ports:
@@ -74,47 +142,188 @@ def find_serial() -> Optional[str]:
     return ports[0].device if ports else None
 
 
-def serial_frames(port: str, baud: int) -> Iterator[Dict[str, float]]:
-    """Yield JSON frames from a serial connection."""
+def _select_lines(fd: int) -> Iterator[bytes]:
+    """Yield newline-terminated chunks from ``fd`` using ``selectors``.
+
+    The process sleeps in ``select`` until the port has data (no 100 ms
+    timeout wake-ups while the room is quiet), then grabs everything waiting
+    with one ``os.read`` and splits it into lines in C. An empty ``b""`` is
+    yielded after each idle half-second so the caller can check for shutdown.
+    """
+
+    sel = selectors.DefaultSelector()
+    sel.register(fd, selectors.EVENT_READ)
+    buf = b""
+    try:
+        while True:
+            if not sel.select(timeout=0.5):
+                yield b""
+                continue
+            chunk = os.read(fd, 4096)
+            if not chunk:  # device unplugged
+                return
+            buf += chunk
+            if b"\n" not in chunk:
+                continue
+            *lines, buf = buf.split(b"\n")
+            yield from lines
+    finally:
+        sel.close()
+
+
+def _buffered_lines(ser: Any) -> Iterator[bytes]:
+    """Portable fallback for ports without a selectable file descriptor."""
+
+    # pyserial's own readline() scans byte-by-byte in Python. A BufferedReader
+    # pulls up to 4 KiB per read and finds newlines in C, so one kernel read
+    # usually covers several frames.
+    reader = io.BufferedReader(ser, buffer_size=4096)
+    pending = b""
+    while True:
+        line = reader.readline()
+        if not line.endswith(b"\n"):
+            # The read timed out mid-frame; keep the fragment for next time.
+            pending += line
+            yield b""
+            continue
+        if pending:
+            line = pending + line
+            pending = b""
+        yield line
+
+
+def _offer(frames: "queue.Queue[Any]", item: Any) -> None:
+    """Enqueue without blocking, dropping the oldest frame when full."""
+
+    try:
+        frames.put_nowait(item)
+    except queue.Full:
+        try:
+            frames.get_nowait()
+        except queue.Empty:
+            pass
+        frames.put_nowait(item)
+
+
+def _serial_reader(
+    lines: Iterator[bytes], frames: "queue.Queue[Any]", stop: threading.Event
+) -> None:
+    """Background thread body: parse serial lines into ``frames``."""
+
+    try:
+        for line in lines:
+            if stop.is_set():
+                return
+            if len(line) < 2:
+                continue
+            try:
+                _offer(frames, _loads(line))
+            except ValueError:  # orjson/json decode errors both subclass this
+                continue
+    except Exception as exc:
+        if not stop.is_set():
+            _offer(frames, exc)
+    finally:
+        _offer(frames, _SERIAL_EOF)
+
 
+def serial_frames(
+    port: str, baud: int, on_idle: Optional[Callable[[], None]] = None
+) -> Iterator[Dict[str, float]]:
+    """Yield JSON frames from a serial connection.
+
+    Reading and JSON parsing run on a daemon thread that feeds a bounded
+    queue, so serial I/O overlaps with mapping and OSC output. If the host
+    falls behind, the oldest frames are dropped: staying live beats
+    replaying a backlog. ``on_idle`` is called whenever the queue has run
+    dry and the generator is about to wait for the port.
+    """
+
+    serial = _optional("serial", "serial")
     if serial is None:
         raise RuntimeError("pyserial not available; cannot read hardware")
     ser = serial.Serial(port, baud, timeout=0.1)
     print(f"# Connected to {port} @ {baud}", file=sys.stderr)
+    try:
+        lines = _select_lines(ser.fileno())
+    except (AttributeError, OSError):  # e.g. Windows COM ports
+        lines = _buffered_lines(ser)
+    frames: "queue.Queue[Any]" = queue.Queue(maxsize=SERIAL_QUEUE_FRAMES)
+    stop = threading.Event()
+    reader = threading.Thread(
+        target=_serial_reader, args=(lines, frames, stop), name="roomlens-serial", daemon=True
+    )
+    reader.start()
     try:
         while True:
-            line = ser.readline().decode("utf-8", errors="ignore").strip()
-            if not line:
-                continue
+            if on_idle is not None and frames.empty():
+                on_idle()
             try:
-                yield json.loads(line)
-            except json.JSONDecodeError:
+                item = frames.get(timeout=1.0)
+            except queue.Empty:
                 continue
+            if item is _SERIAL_EOF:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
     finally:
+        stop.set()
+        reader.join(timeout=1.0)
         ser.close()
 
 
-def demo_frames() -> Iterator[Dict[str, float]]:
-    """Synthesize frames indefinitely using :func:`roomlens.demo.demo_frame`."""
+def demo_frames(on_idle: Optional[Callable[[], None]] = None) -> Iterator[Dict[str, float]]:
+    """Synthesize frames indefinitely using :func:`roomlens.demo.demo_frame`.
+
+    ``on_idle`` is called before each sleep between frames.
+    """
 
     t0 = time.time()
+    # Sleep until an absolute deadline rather than a fixed 40 ms so the time
+    # spent mapping/printing each frame doesn't stretch the 25 Hz cadence.
+    deadline = time.monotonic()
     while True:
         t = time.time() - t0
         yield demo_frame(t)
-        time.sleep(0.04)
+        deadline += DEMO_FRAME_SECONDS
+        if on_idle is not None:
+            on_idle()
+        sleep_s = deadline - time.monotonic()
+        if sleep_s > 0:
+            time.sleep(sleep_s)
+        elif sleep_s < -DEMO_FRAME_SECONDS:
+            # More than a frame behind (a suspended laptop, a blocked
+            # stdout): start over from now instead of bursting out frames
+            # until the old deadline is caught up.
+            deadline = time.monotonic()
 
 
 def setup_pipeline(args: argparse.Namespace) -> MappingPipeline:
     """Load the mapping file and prepare the shared pipeline instance."""
 
-    mapping = load_mapping(Path(args.mapping))
-    pipeline = MappingPipeline(mapping)
+    mapping_path = Path(args.mapping)
+    if mapping_path.suffix.lower() not in (".json", ".toml"):
+        # Only YAML mappings need PyYAML; asking for the loader imports it.
+        loader = yaml_loader().__name__
+        print(f"# YAML loader: {loader}", file=sys.stderr)
+        if loader != "CSafeLoader":
+            print("# tip: a PyYAML built with libyaml loads mappings much faster", file=sys.stderr)
+    mapping = load_mapping(mapping_path)
+    # The main loop serializes each payload before the next frame, so the
+    # pipeline can recycle one axes dict instead of allocating per frame.
+    pipeline = MappingPipeline(mapping, reuse_axes=True, detect_repeats=True)
     if args.osc:
+        udp_client = _optional("udp_client", "pythonosc.udp_client")
         if udp_client is None:
             print("# python-osc not available; cannot send OSC", file=sys.stderr)
         else:
             try:
                 client = udp_client.SimpleUDPClient("127.0.0.1", args.osc)
+                if args.osc_batch > 1:
+                    client = OscBatcher(
+                        client, max_messages=args.osc_batch, bundle=args.osc_bundle
+                    )
                 pipeline.bind_osc_client(client)
                 print(f"# OSC → 127.0.0.1:{args.osc}", file=sys.stderr)
             except Exception as exc:  # pragma: no cover - UI feedback only
@@ -122,22 +331,28 @@ def setup_pipeline(args: argparse.Namespace) -> MappingPipeline:
     return pipeline
 
 
-def frame_iterator(args: argparse.Namespace) -> Iterator[Dict[str, float]]:
-    """Select the appropriate frame source based on CLI flags."""
+def frame_iterator(
+    args: argparse.Namespace, on_idle: Optional[Callable[[], None]] = None
+) -> Iterator[Dict[str, float]]:
+    """Select the appropriate frame source based on CLI flags.
 
-    if args.demo or serial is None:
-        return demo_frames()
+    ``on_idle`` is handed to the source, which calls it right before it
+    blocks waiting for the next frame.
+    """
+
+    if args.demo or _optional("serial", "serial") is None:
+        return demo_frames(on_idle=on_idle)
 
     port = find_serial() if args.port == "auto" else args.port
     if not port:
         print("# No serial device found; falling back to --demo", file=sys.stderr)
-        return demo_frames()
+        return demo_frames(on_idle=on_idle)
 
     try:
-        return serial_frames(port, args.baud)
+        return serial_frames(port, args.baud, on_idle=on_idle)
     except Exception as exc:
         print(f"# Serial open failed ({exc}); falling back to --demo", file=sys.stderr)
-        return demo_frames()
+        return demo_frames(on_idle=on_idle)
 
 
 def main() -> None:
@@ -156,32 +371,80 @@ def main() -> None:
         default=0,
         help="OSC out port (0=disabled; pair with host/supercollider/RoomLens.scd on 57120)",
     )
+    ap.add_argument(
+        "--osc-batch",
+        type=int,
+        default=1,
+        help=(
+            "drain up to N frames per send during bursts; on Linux one sendmmsg "
+            "syscall (1=send every frame at once)"
+        ),
+    )
+    ap.add_argument(
+        "--osc-bundle",
+        action="store_true",
+        help="with --osc-batch, wrap each burst in one OSC bundle instead of separate datagrams",
+    )
     ap.add_argument("--demo", action="store_true", help="Ignore serial; generate frames")
     ap.add_argument("--dry-audio", action="store_true", help="Do not render sound; print mappings")
+    ap.add_argument("--quiet", action="store_true", help="Never print axis payloads to stdout")
     args = ap.parse_args()
 
     pipeline = setup_pipeline(args)
-    frames = frame_iterator(args)
 
-    for i, frame in enumerate(frames, start=1):
-        payload = pipeline.process_frame(frame)
+    out = sys.stdout.buffer
+    atexit.register(out.flush)
+    unflushed = 0
+    last_flush = time.monotonic()
+    last_osc_send = float("-inf")
+
+    def on_idle() -> None:
+        # The source is about to wait: push out everything still buffered.
+        nonlocal unflushed, last_flush
+        if unflushed:
+            out.flush()
+            unflushed = 0
+            last_flush = time.monotonic()
+        try:
+            pipeline.flush_osc()
+        except Exception as exc:  # pragma: no cover - UI feedback only
+            print(f"# OSC send failed: {exc}", file=sys.stderr)
+
+    frames = frame_iterator(args, on_idle=on_idle)
 
-        sent = False
-        if pipeline.has_osc_client:
-            try:
-                sent = pipeline.emit_osc(payload)
-            except Exception as exc:  # pragma: no cover - UI feedback only
-                sent = False
-                print(f"# OSC send failed: {exc}", file=sys.stderr)
-
-        if args.dry_audio or not sent:
-            print(json.dumps(payload), flush=True)
-
-        if i % 100 == 0:
-            print(
-                "# tip: edit config/mapping.default.yaml and watch axes shift in real time",
-                file=sys.stderr,
-            )
+    try:
+        for i, frame in enumerate(frames, start=1):
+            payload = pipeline.process_frame(frame)
+
+            sent = False
+            if pipeline.has_osc_client and pipeline.last_frame_repeated and (
+                time.monotonic() - last_osc_send < OSC_KEEPALIVE_SECONDS
+            ):
+                sent = True  # the synth already holds these exact values
+            elif pipeline.has_osc_client:
+                try:
+                    sent = pipeline.emit_osc(payload)
+                    last_osc_send = time.monotonic()
+                except Exception as exc:  # pragma: no cover - UI feedback only
+                    sent = False
+                    print(f"# OSC send failed: {exc}", file=sys.stderr)
+
+            if not args.quiet and (args.dry_audio or not sent):
+                out.write(_dumps(payload) + b"\n")
+                unflushed += 1
+                now = time.monotonic()
+                if unflushed >= STDOUT_FLUSH_FRAMES or now - last_flush >= STDOUT_FLUSH_SECONDS:
+                    out.flush()
+                    unflushed = 0
+                    last_flush = now
+
+            if i % 100 == 0:
+                print(
+                    "# tip: edit config/mapping.default.yaml and watch axes shift in real time",
+                    file=sys.stderr,
+                )
+    finally:
+        pipeline.flush_osc()
 
 
 if __name__ == "__main__":
@@ -9,11 +9,48 @@ custom profile) immediately reflect in the replay stream.
 from __future__ import annotations
 
 import argparse
+import itertools
 import json
 import sys
 import time
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List
+from typing import Any, Dict, Iterable, Iterator, List
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - stdlib json is plenty for demos
+    orjson = None  # type: ignore[assignment]
+try:
+    import msgspec
+except Exception:  # pragma: no cover - optional, orjson/stdlib cover output
+    msgspec = None  # type: ignore[assignment]
+
+# Parsing and serializing are the only real work in a replay loop; orjson
+# takes bytes straight from the file and hands bytes back for stdout.
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:  # pragma: no cover - exercised only without orjson installed
+    def _loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
+    def _dumps(payload: Dict[str, object]) -> bytes:
+        # Compact separators, so output matches orjson byte for byte.
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+# Every payload has the same ``{"t": ..., "axes": {...}}`` shape, so when
+# msgspec is installed a Struct encoder (specialized per field, no per-value
+# type dispatch on the outer object) takes over output.
+if msgspec is not None:  # pragma: no cover - msgspec is optional
+
+    class AxesPayload(msgspec.Struct):
+        t: Any
+        axes: Dict[str, float]
+
+    _encode_payload = msgspec.json.Encoder().encode
+
+    def _dumps(payload: Dict[str, Any]) -> bytes:  # type: ignore[no-redef]
+        return _encode_payload(AxesPayload(payload["t"], payload["axes"]))
 
 # Make ``roomlens`` importable when running from repo root.
 ROOT = Path(__file__).resolve().parents[2]
@@ -22,23 +59,50 @@ if str(ROOT) not in sys.path:
 
 from roomlens import MappingPipeline  # noqa: E402  (repo-local import)
 
+# Frames mapped per vectorized ``process_batch`` call when NumPy is around.
+BATCH_FRAMES = 1024
+# Bulk replays collect this many bytes of NDJSON per ``write`` to stdout.
+OUTPUT_CHUNK_BYTES = 64 * 1024
 
-def load_recording(path: Path) -> List[Dict[str, float]]:
-    """Return a list of JSON frames from ``path`` (newline-delimited JSON)."""
+
+def _parse_lines(lines: Iterable[bytes]) -> List[Dict[str, float]]:
+    """Decode NDJSON ``lines`` one at a time, naming the first bad line."""
 
     frames: List[Dict[str, float]] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for idx, raw in enumerate(handle, start=1):
-            line = raw.strip()
-            if not line:
-                continue
-            try:
-                frame = json.loads(line)
-            except json.JSONDecodeError as exc:  # pragma: no cover - user feedback
-                raise ValueError(f"Line {idx} is not valid JSON: {exc}") from exc
-            if not isinstance(frame, dict):
-                raise ValueError(f"Line {idx} must decode to an object, got {type(frame)!r}")
-            frames.append(frame)
+    for idx, line in enumerate(lines, start=1):
+        if not line or line.isspace():
+            continue
+        try:
+            frame = _loads(line)
+        except ValueError as exc:  # pragma: no cover - user feedback
+            raise ValueError(f"Line {idx} is not valid JSON: {exc}") from exc
+        if not isinstance(frame, dict):
+            raise ValueError(f"Line {idx} must decode to an object, got {type(frame)!r}")
+        frames.append(frame)
+    return frames
+
+
+def load_recording(path: Path) -> List[Dict[str, float]]:
+    """Return a list of JSON frames from ``path`` (newline-delimited JSON).
+
+    The non-blank lines are joined into one JSON array and decoded with a
+    single parser call, so startup scales with bytes rather than lines. If
+    that array does not come back as exactly one object per line, the file is
+    re-read line by line purely to report where it went wrong.
+    """
+
+    lines = path.read_bytes().splitlines()
+    records = [line for line in lines if line and not line.isspace()]
+    try:
+        frames = _loads(b"[" + b",".join(records) + b"]")
+    except ValueError:
+        frames = None
+    if (
+        not isinstance(frames, list)
+        or len(frames) != len(records)
+        or not all(type(frame) is dict for frame in frames)
+    ):
+        frames = _parse_lines(lines)
     if not frames:
         raise ValueError(f"Recording {path} did not contain any frames")
     return frames
@@ -47,11 +111,45 @@ def load_recording(path: Path) -> List[Dict[str, float]]:
 def iter_frames(frames: List[Dict[str, float]], loop: bool) -> Iterator[Dict[str, float]]:
     """Yield ``frames`` once or forever depending on ``loop``."""
 
+    # C-level iterators; no Python generator frame resumed per replayed frame.
+    return itertools.cycle(frames) if loop else iter(frames)
+
+
+def iter_payloads(
+    pipeline: MappingPipeline, frames: Iterable[Dict[str, float]], *, batch: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """Yield ``process_frame``-style payloads for ``frames``.
+
+    By default each frame goes through :meth:`MappingPipeline.process_frame`,
+    exactly like the live host, and is yielded as soon as it is mapped. With
+    ``batch=True`` (and NumPy installed) frames are mapped
+    :data:`BATCH_FRAMES` at a time through
+    :meth:`MappingPipeline.process_batch` instead. That is much quicker for
+    bulk output, but the vectorized math can differ from the per-frame path
+    in the last bit of a float, so the output is not byte-identical to what
+    the host would print, and nothing is yielded until a whole batch is in.
+    """
+
+    if not batch:
+        yield from pipeline.iter_process(frames)
+        return
+    try:
+        import numpy  # noqa: F401
+    except ImportError:  # pragma: no cover - numpy is optional
+        yield from pipeline.iter_process(frames)
+        return
+
+    frames = iter(frames)
     while True:
-        for frame in frames:
-            yield frame
-        if not loop:
-            break
+        chunk = list(itertools.islice(frames, BATCH_FRAMES))
+        if not chunk:
+            return
+        columns = {axis: col.tolist() for axis, col in pipeline.process_batch(chunk).items()}
+        for i, frame in enumerate(chunk):
+            yield {
+                "t": frame.get("t"),
+                "axes": {axis: values[i] for axis, values in columns.items()},
+            }
 
 
 def main(argv: Iterable[str] | None = None) -> int:
@@ -85,6 +183,15 @@ def main(argv: Iterable[str] | None = None) -> int:
         default=0,
         help="stop after this many frames (0 = entire replay)",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help=(
+            "map frames in vectorized NumPy batches for fast bulk output; values may "
+            "differ from the live host in the last float digit (ignored with --sleep "
+            "or --max-frames)"
+        ),
+    )
     args = parser.parse_args(list(argv) if argv is not None else None)
 
     recording_path = Path(args.file)
@@ -99,15 +206,33 @@ def main(argv: Iterable[str] | None = None) -> int:
 
     pipeline = MappingPipeline.from_yaml(Path(args.mapping))
 
+    # Paced replays (--sleep) write every frame straight away so a listener
+    # sees live timing; bulk replays batch output into large writes.
+    out = sys.stdout.buffer
+    live = args.sleep > 0
+    # Paced or limited runs map frame by frame so each one is emitted (and
+    # matches the host) the moment it is ready.
+    batch = args.batch and not live and not args.max_frames
+    buf = bytearray()
     emitted = 0
-    for frame in iter_frames(frames, args.loop):
-        payload = pipeline.process_frame(frame)
-        print(json.dumps(payload), flush=True)
-        emitted += 1
-        if args.max_frames and emitted >= args.max_frames:
-            break
-        if args.sleep > 0:
-            time.sleep(args.sleep)
+    try:
+        for payload in iter_payloads(pipeline, iter_frames(frames, args.loop), batch=batch):
+            buf += _dumps(payload)
+            buf += b"\n"
+            if live or len(buf) >= OUTPUT_CHUNK_BYTES:
+                out.write(buf)
+                buf.clear()
+                if live:
+                    out.flush()
+            emitted += 1
+            if args.max_frames and emitted >= args.max_frames:
+                break
+            if live:
+                time.sleep(args.sleep)
+    finally:
+        # Also runs on Ctrl-C so a looping rehearsal does not lose its tail.
+        out.write(buf)
+        out.flush()
 
     return 0
 
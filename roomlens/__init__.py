@@ -10,32 +10,47 @@ The primary entry points are:
 - :class:`roomlens.pipeline.MappingPipeline` – a reusable sensor→axes bridge
   that mirrors the behaviour of ``host/python/app.py``.
 - :func:`roomlens.mapping.load_mapping` – parse the YAML mapping file shared
-  across the repo.
+  across the repo. Parsed files are cached by stat, so repeated loads are
+  cheap; :func:`roomlens.mapping.clear_mapping_cache` drops the cache.
 - :func:`roomlens.demo.demo_frame` – deterministic fake sensor frames for
-  rehearsals without hardware attached.
+  rehearsals without hardware attached (:func:`roomlens.demo.demo_frames`
+  builds many at once with NumPy).
 
 Each module is self-contained and plain Python so it can be imported by the
 CLI host, the data capture tools, or any notebook you spin up in class.
 """
 
-from .demo import demo_frame
+from .demo import demo_frame, demo_frames
 from .mapping import (
+    CompiledMapping,
     SensorProcessor,
     apply_mapping,
+    apply_mapping_batch,
+    apply_mapping_into,
     clamp01,
+    clear_mapping_cache,
+    compile_mapping,
     lerp,
     load_mapping,
     validate_mapping_axes,
 )
+from .osc import OscBatcher
 from .pipeline import MappingPipeline
 
 __all__ = [
     "apply_mapping",
+    "apply_mapping_batch",
+    "apply_mapping_into",
     "clamp01",
+    "clear_mapping_cache",
+    "compile_mapping",
+    "CompiledMapping",
     "demo_frame",
+    "demo_frames",
     "MappingPipeline",
     "lerp",
     "load_mapping",
+    "OscBatcher",
     "SensorProcessor",
     "validate_mapping_axes",
 ]
@@ -0,0 +1,61 @@
+"""Optional Numba hook.
+
+``njit`` compiles numeric helpers to machine code when Numba is installed and
+quietly hands back the plain Python function when it is not, so every module
+stays importable on a bare classroom laptop. Numba itself (and LLVM behind
+it) is only imported the first time a decorated function is called: loading
+it costs far more than ``import roomlens`` does otherwise, and hosts that
+never touch a kernel should not pay for it. ``HAVE_NUMBA`` only checks that
+the package is installed, so callers can pick a different strategy (e.g.
+NumPy array expressions) without triggering that import. Kernels write
+``prange`` for parallel loops; it is plain ``range`` until Numba compiles
+them.
+"""
+from __future__ import annotations
+
+import functools
+import importlib.util
+import types
+from typing import Any, Callable
+
+HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+
+prange = range
+
+
+def _compile(fn: Callable[..., Any], options: dict[str, Any]) -> Callable[..., Any]:
+    """Return ``fn`` compiled by Numba, or ``fn`` itself if that fails."""
+
+    try:
+        import numba
+    except Exception:  # pragma: no cover - numba is an optional speedup
+        return fn
+    # The module-level ``prange`` is still ``range``; hand Numba a copy of the
+    # function that sees the real ``numba.prange`` so parallel loops split.
+    scope = dict(fn.__globals__, prange=numba.prange)
+    clone = types.FunctionType(fn.__code__, scope, fn.__name__, fn.__defaults__, fn.__closure__)
+    functools.update_wrapper(clone, fn)
+    return numba.njit(**options)(clone)
+
+
+def njit(**options: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Lazy stand-in for :func:`numba.njit` (keyword options only)."""
+
+    def wrap(fn: Callable[..., Any]) -> Callable[..., Any]:
+        if not HAVE_NUMBA:
+            return fn
+        impl = None
+
+        @functools.wraps(fn)
+        def call(*args: Any) -> Any:
+            nonlocal impl
+            if impl is None:
+                impl = _compile(fn, options)
+            return impl(*args)
+
+        return call
+
+    return wrap
+
+
+__all__ = ["HAVE_NUMBA", "njit", "prange"]
@@ -0,0 +1,31 @@
+"""Per-frame mapping loop, split out so it can be compiled ahead of time.
+
+Everything here is plain, fully annotated Python. Left alone it runs as-is;
+run ``mypyc roomlens/_mapping_core.py`` from the repo root and Python will
+pick up the compiled extension sitting next to this file instead, with no
+other code changes. Delete the ``.so``/``.pyd`` to go back. Mappings built by
+``compile_mapping`` normally run through their generated ``kernel`` instead,
+which measured faster even against a mypyc build of this loop; this is the
+fallback for a :class:`~roomlens.mapping.CompiledMapping` without one.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+# One flattened feature: (resolver, transform, axis, lo, scale), where
+# ``scale`` is the precomputed ``hi - lo`` of the axis range.
+CompiledFeature = Tuple[
+    Callable[[Mapping[str, Any]], float], Callable[[float], float], str, float, float
+]
+
+
+def map_entries(
+    frame: Mapping[str, Any], entries: List[CompiledFeature], axes: Dict[str, float]
+) -> None:
+    """Resolve, transform, clamp, and scale each compiled feature into ``axes``."""
+
+    for resolver, transform, axis, lo, scale in entries:
+        t: float = transform(resolver(frame))
+        # Written so NaN fails the first test and clamps to 0.0, like clamp01.
+        t = 0.0 if not t > 0.0 else 1.0 if t > 1.0 else t
+        axes[axis] = lo + scale * t
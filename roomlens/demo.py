@@ -10,7 +10,26 @@ from __future__ import annotations
 
 import math
 import time
-from typing import Dict
+from typing import Any, Dict, Tuple
+
+from ._jit import njit
+
+
+@njit(cache=True, fastmath=True)
+def _demo_core(t: float) -> Tuple[float, float, float, float, float, float]:
+    """Numeric heart of :func:`demo_frame`: the six LFO wobbles at time ``t``.
+
+    Each wobble is ``0.5 + 0.5 * sin(f t) * cos(0.7 f t)``, a cheap LFO stack
+    used to fake sensor motion. Kept free of dicts so Numba can compile it.
+    """
+
+    w17 = 0.5 + 0.5 * math.sin(1.7 * t) * math.cos(0.7 * 1.7 * t)
+    w09 = 0.5 + 0.5 * math.sin(0.9 * t) * math.cos(0.7 * 0.9 * t)
+    w23 = 0.5 + 0.5 * math.sin(2.3 * t) * math.cos(0.7 * 2.3 * t)
+    w05 = 0.5 + 0.5 * math.sin(0.5 * t) * math.cos(0.7 * 0.5 * t)
+    w01 = 0.5 + 0.5 * math.sin(0.1 * t) * math.cos(0.7 * 0.1 * t)
+    w31 = 0.5 + 0.5 * math.sin(3.1 * t) * math.cos(0.7 * 3.1 * t)
+    return w17, w09, w23, w05, w01, w31
 
 
 def demo_frame(t: float | None = None) -> Dict[str, float]:
@@ -34,21 +53,57 @@ def demo_frame(t: float | None = None) -> Dict[str, float]:
     if t is None:
         t = time.time()
 
-    def wob(freq: float) -> float:
-        """Cheap LFO stack used to fake sensor motion for demos."""
+    w17, w09, w23, tof_near, w01, w31 = _demo_core(float(t))
+
+    return {
+        "t": int(time.time() * 1000),
+        "mic_rms": 0.12 + 0.1 * w17,
+        "mic_sc": 0.40 + 0.3 * w09,
+        "tof_motion": abs(0.5 - w23) * 2.0,
+        "tof_near": tof_near,
+        "distance_cm": 25.0 + (1.0 - tof_near) * 150.0,
+        "lux": 0.3 + 0.6 * w01,
+        "flicker": w31,
+        "motion": 1 if w23 > 0.65 else 0,
+    }
+
+
+# The six LFO rates behind the wobbles in ``_demo_core``, in the same order.
+_DEMO_RATES = (1.7, 0.9, 2.3, 0.5, 0.1, 3.1)
+
+
+def demo_frames(ts: Any) -> Dict[str, Any]:
+    """Vectorized :func:`demo_frame`: one NumPy array per key for many times.
+
+    Parameters
+    ----------
+    ts:
+        Sequence or array of times in seconds.
 
-        return 0.5 + 0.5 * math.sin(freq * t) * math.cos(0.7 * freq * t)
+    Returns
+    -------
+    dict
+        Structure-of-arrays version of :func:`demo_frame` — same keys, each
+        holding one value per entry in ``ts``. Unlike the scalar helper, ``t``
+        is derived from ``ts`` itself (milliseconds), which is what you want
+        when synthesizing a recording. Requires NumPy; :func:`demo_frame`
+        stays the dependency-free path for one frame at a time.
+    """
 
-    tof_near = wob(0.5)
+    import numpy as np
 
+    ts = np.asarray(ts, dtype=np.float64)
+    w17, w09, w23, tof_near, w01, w31 = (
+        0.5 + 0.5 * np.sin(rate * ts) * np.cos(0.7 * rate * ts) for rate in _DEMO_RATES
+    )
     return {
-        "t": int(time.time() * 1000),
-        "mic_rms": 0.12 + 0.1 * wob(1.7),
-        "mic_sc": 0.40 + 0.3 * wob(0.9),
-        "tof_motion": abs(0.5 - wob(2.3)) * 2.0,
+        "t": np.rint(ts * 1000.0).astype(np.int64),
+        "mic_rms": 0.12 + 0.1 * w17,
+        "mic_sc": 0.40 + 0.3 * w09,
+        "tof_motion": np.abs(0.5 - w23) * 2.0,
         "tof_near": tof_near,
         "distance_cm": 25.0 + (1.0 - tof_near) * 150.0,
-        "lux": 0.3 + 0.6 * wob(0.1),
-        "flicker": wob(3.1),
-        "motion": 1 if wob(2.3) > 0.65 else 0,
+        "lux": 0.3 + 0.6 * w01,
+        "flicker": w31,
+        "motion": (w23 > 0.65).astype(np.int64),
     }
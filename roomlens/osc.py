@@ -0,0 +1,292 @@
+"""OSC output helpers shared by the hosts.
+
+Live performance wants every frame on the wire the moment it exists. Bursty
+sources (a Teensy dumping a backlog, a fast replay) are different: one UDP
+``sendto`` per frame turns the kernel boundary into the bottleneck. The
+:class:`OscBatcher` here wraps a python-osc client and drains bursts in one go
+while leaving slow, steady streams untouched. On Linux a drained burst leaves
+as separate datagrams through a single ``sendmmsg`` syscall; receivers that
+understand OSC bundles can ask for one bundle packet instead.
+
+The axis list is fixed once a mapping is compiled, so :class:`OscAxesEncoder`
+pre-encodes the address, type tags, and axis names and only packs the float
+values per frame — no per-frame message builder at all.
+"""
+from __future__ import annotations
+
+import ctypes
+import os
+import socket
+import struct
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+def _osc_string(text: str) -> bytes:
+    """Encode ``text`` as an OSC string: UTF-8, NUL-terminated, padded to 4 bytes."""
+
+    data = text.encode("utf-8")
+    return data + b"\0" * (4 - len(data) % 4)
+
+
+# "#bundle" + NUL, then the special "immediately" time tag (0x...01).
+_BUNDLE_HEADER = _osc_string("#bundle") + struct.pack("!Q", 1)
+
+
+class OscAxesEncoder:
+    """Encode ``[axis, value, axis, value, ...]`` messages for fixed axes.
+
+    The bytes match what python-osc's ``OscMessageBuilder`` produces for the
+    same arguments (``s``/``f`` pairs, big-endian float32), but the header and
+    names are built once and each frame costs a single ``struct.pack``.
+    """
+
+    def __init__(self, address: str, axes: Iterable[str]) -> None:
+        self.address = address
+        self.axes = tuple(axes)
+        names = [_osc_string(axis) for axis in self.axes]
+        self._header = _osc_string(address) + _osc_string("," + "sf" * len(names))
+        self._struct = struct.Struct("!" + "".join(f"{len(name)}sf" for name in names))
+        # Even slots hold the encoded names; odd slots get each frame's values.
+        self._args: List[Any] = [None] * (2 * len(names))
+        self._args[0::2] = names
+
+    def encode(self, values: Sequence[float]) -> bytes:
+        """Return the OSC datagram for ``values`` (ordered like :attr:`axes`)."""
+
+        args = self._args
+        args[1::2] = values
+        return self._header + self._struct.pack(*args)
+
+
+# ``sendmmsg`` accepts at most UIO_MAXIOV messages; 64 keeps each call small.
+SENDMMSG_MAX = 64
+
+
+class _IoVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IoVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+def _load_sendmmsg() -> Optional[Callable[..., int]]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        # ``CDLL(None)`` is the running interpreter, which already links libc;
+        # ``ctypes.util.find_library`` would shell out and pull in subprocess.
+        libc = ctypes.CDLL(None, use_errno=True)
+        fn = libc.sendmmsg
+    except (OSError, AttributeError):  # pragma: no cover - exotic libc
+        return None
+    fn.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int]
+    fn.restype = ctypes.c_int
+    return fn
+
+
+_SENDMMSG = _load_sendmmsg()
+
+
+class _MmsgSender:
+    """Preallocated ``sendmmsg`` headers for one IPv4 destination.
+
+    Every header points at the same address and its own single ``iovec``, so
+    a send only has to aim each ``iovec`` into one joined payload buffer.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        # struct sockaddr_in: host-order family, network-order port, address, padding.
+        sockaddr = (
+            struct.pack("=H", socket.AF_INET)
+            + struct.pack("!H", port)
+            + socket.inet_aton(socket.gethostbyname(host))
+            + bytes(8)
+        )
+        self._dest = ctypes.create_string_buffer(sockaddr, len(sockaddr))
+        self._iovecs = (_IoVec * SENDMMSG_MAX)()
+        self._msgs = (_MMsgHdr * SENDMMSG_MAX)()
+        for i in range(SENDMMSG_MAX):
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_name = ctypes.addressof(self._dest)
+            hdr.msg_namelen = len(sockaddr)
+            hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            hdr.msg_iovlen = 1
+        self._base = ctypes.addressof(self._msgs)
+
+    def send(self, sock: socket.socket, datagrams: Sequence[bytes]) -> None:
+        sendmmsg = _SENDMMSG
+        if sendmmsg is None:
+            raise OSError("sendmmsg is not available on this platform")
+        fd = sock.fileno()
+        iovecs = self._iovecs
+        for start in range(0, len(datagrams), SENDMMSG_MAX):
+            chunk = datagrams[start : start + SENDMMSG_MAX]
+            # One joined copy instead of a ctypes buffer per datagram; ``blob``
+            # stays referenced until the syscall returns.
+            blob = b"".join(chunk)
+            addr = ctypes.cast(ctypes.c_char_p(blob), ctypes.c_void_p).value or 0
+            for iov, data in zip(iovecs, chunk):
+                size = len(data)
+                iov.iov_base = addr
+                iov.iov_len = size
+                addr += size
+            count = len(chunk)
+            sent = 0
+            while sent < count:
+                # The kernel may stop early (e.g. a full send buffer); resume there.
+                n = sendmmsg(fd, self._base + sent * _MMSGHDR_SIZE, count - sent, 0)
+                if n < 0:
+                    err = ctypes.get_errno()
+                    raise OSError(err, f"sendmmsg failed: {os.strerror(err)}")
+                sent += n
+
+
+_MMSGHDR_SIZE = ctypes.sizeof(_MMsgHdr)
+_MMSG_SENDERS: Dict[Tuple[str, int], _MmsgSender] = {}
+
+
+def send_datagrams(client: Any, datagrams: Sequence[bytes]) -> bool:
+    """Ship several pre-encoded OSC messages as separate datagrams.
+
+    On Linux, python-osc UDP clients aimed at an IPv4 host get one
+    ``sendmmsg`` syscall per :data:`SENDMMSG_MAX` messages; everything else
+    falls back to a :func:`send_datagram` loop. Returns ``False`` when the
+    client cannot take raw bytes at all.
+    """
+
+    sock = getattr(client, "_sock", None)
+    if _SENDMMSG is not None and isinstance(sock, socket.socket) and sock.family == socket.AF_INET:
+        key = (client._address, client._port)
+        sender = _MMSG_SENDERS.get(key)
+        if sender is None:
+            sender = _MMSG_SENDERS[key] = _MmsgSender(*key)
+        sender.send(sock, datagrams)
+        return True
+    for data in datagrams:
+        if not send_datagram(client, data):
+            return False
+    return True
+
+
+def send_datagram(client: Any, data: bytes) -> bool:
+    """Ship pre-encoded OSC bytes through ``client``.
+
+    Works with :class:`OscBatcher` and python-osc's UDP clients. Returns
+    ``False`` when the client only speaks ``send_message`` so callers can fall
+    back to the slow path.
+    """
+
+    send_raw = getattr(client, "send_datagram", None)
+    if send_raw is not None:
+        send_raw(data)
+        return True
+    sock = getattr(client, "_sock", None)
+    if sock is None:
+        return False
+    sock.sendto(data, (client._address, client._port))
+    return True
+
+
+class OscBatcher:
+    """Client wrapper that drains queued messages in as few syscalls as possible.
+
+    Parameters
+    ----------
+    client:
+        A python-osc ``SimpleUDPClient``, or anything :func:`send_datagram`
+        can push raw bytes through.
+    max_messages:
+        Flush as soon as this many messages are waiting.
+    max_delay:
+        A message arriving at least this many seconds after the previous send
+        goes out immediately, so a steady stream at demo rates (25 Hz) is
+        never held back. Messages that arrive faster than that are queued
+        and flushed once the oldest is this old (checked on the next send,
+        or call :meth:`flush` when the source goes idle).
+    bundle:
+        Wrap a burst in one OSC bundle packet instead of sending each message
+        as its own datagram. Fewer packets, but the receiver has to unpack
+        bundles (SuperCollider does; some patchers do not).
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        max_messages: int = 16,
+        max_delay: float = 0.005,
+        clock: Callable[[], float] = time.monotonic,
+        bundle: bool = False,
+    ) -> None:
+        self.client = client
+        self.bundle = bundle
+        self.max_messages = max(int(max_messages), 1)
+        self.max_delay = float(max_delay)
+        self._clock = clock
+        self._pending: List[bytes] = []
+        self._oldest = 0.0
+        self._last_sent = float("-inf")
+
+    def send_message(self, address: str, args: Sequence[Any]) -> None:
+        """Encode and queue one message, flushing if the batch is full or stale."""
+
+        from pythonosc.osc_message_builder import OscMessageBuilder
+
+        msg = OscMessageBuilder(address=address)
+        for arg in args:
+            msg.add_arg(arg)
+        self.send_datagram(msg.build().dgram)
+
+    def send_datagram(self, data: bytes) -> None:
+        """Queue one pre-encoded OSC message (see :class:`OscAxesEncoder`)."""
+
+        now = self._clock()
+        pending = self._pending
+        if not pending:
+            if now - self._last_sent >= self.max_delay:
+                # Nothing sent recently: this is not a burst, so no waiting.
+                self._send([data], now)
+                return
+            self._oldest = now
+        pending.append(data)
+        if len(pending) >= self.max_messages or now - self._oldest >= self.max_delay:
+            self.flush()
+
+    def flush(self) -> None:
+        """Send everything queued so far."""
+
+        pending, self._pending = self._pending, []
+        if pending:
+            self._send(pending, self._clock())
+
+    def _send(self, pending: List[bytes], now: float) -> None:
+        self._last_sent = now
+        if len(pending) == 1:
+            # A lone message does not need the bundle wrapper or sendmmsg.
+            sent = send_datagram(self.client, pending[0])
+        elif self.bundle:
+            sent = send_datagram(
+                self.client,
+                _BUNDLE_HEADER + b"".join(struct.pack("!i", len(msg)) + msg for msg in pending),
+            )
+        else:
+            sent = send_datagrams(self.client, pending)
+        if not sent:
+            raise TypeError(
+                f"{type(self.client).__name__} cannot send raw OSC datagrams"
+            )
@@ -3,15 +3,25 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping, MutableMapping, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from .mapping import (
+    CompiledMapping,
     MappingDict,
     SensorProcessor,
     apply_mapping,
+    apply_mapping_batch,
+    apply_mapping_into,
+    compile_mapping,
     load_mapping,
-    validate_mapping_axes,
 )
+from .osc import OscAxesEncoder, send_datagram
+
+
+# Public fields baked into the compiled state, and those the repeat memo
+# depends on; see ``MappingPipeline.__setattr__``.
+_RECOMPILE_FIELDS = frozenset({"mapping", "processors", "osc_address"})
+_RESET_FIELDS = frozenset({"reuse_axes", "detect_repeats"})
 
 
 @dataclass
@@ -21,15 +31,72 @@ class MappingPipeline:
     The class keeps the same behaviour as ``host/python/app.py`` but wraps it in
     a reusable, testable object. Scripts across the repo can share one
     ``MappingPipeline`` instance and therefore agree on mapping semantics.
+
+    Set ``reuse_axes=True`` when every payload is consumed before the next
+    frame arrives (the CLI host serializes immediately). The pipeline then
+    writes each frame's axes into one long-lived dict instead of allocating a
+    fresh one, so hold on to ``dict(payload["axes"])`` if you need history.
+
+    Set ``detect_repeats=True`` to have frames that differ from the previous
+    one only by ``t`` skip the mapping and reuse its axes (see
+    :attr:`last_frame_repeated`). It costs a shallow copy and compare per
+    frame, which only pays off for sources that idle on identical frames,
+    so it is off by default.
+
+    Assigning ``mapping``, ``processors``, or ``osc_address`` recompiles the
+    pipeline; changing ``reuse_axes`` or ``detect_repeats`` calls
+    :meth:`reset`.
     """
 
     mapping: MappingDict
     processors: Optional[Mapping[str, SensorProcessor]] = None
     osc_address: str = "/roomlens"
+    reuse_axes: bool = False
+    detect_repeats: bool = False
     _osc_client: Any = field(default=None, repr=False)
+    _compiled: CompiledMapping = field(init=False, repr=False)
+    _osc_encoder: OscAxesEncoder = field(init=False, repr=False)
+    # Last frame (minus its timestamp) and the axes it produced, see process_frame.
+    _last_frame: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    _last_axes: Dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    _repeated: bool = field(default=False, init=False, repr=False)
+    _axes_buf: Dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    # ``[axis, None, axis, None, ...]`` in OSC order; copied and filled per frame.
+    _osc_template: List[Any] = field(default_factory=list, init=False, repr=False)
 
     def __post_init__(self) -> None:
-        validate_mapping_axes(self.mapping)
+        self._compile(self.mapping)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # ``_compiled`` only exists once __post_init__ has run.
+        if "_compiled" not in self.__dict__:
+            return
+        if name in _RECOMPILE_FIELDS:
+            self._compile(self.mapping)
+        elif name in _RESET_FIELDS:
+            self.reset()
+
+    def _compile(self, mapping: MappingDict) -> None:
+        # One walk of the YAML tree both validates axes and flattens features.
+        self._compiled = compile_mapping(mapping, processors=self.processors, validate=True)
+        self._osc_encoder = OscAxesEncoder(self.osc_address, self._compiled.osc_order)
+        self._osc_template = [None] * (2 * len(self._compiled.osc_order))
+        self._osc_template[0::2] = self._compiled.osc_order
+        self.reset()
+        self._axes_buf = dict.fromkeys(
+            (axis for _, _, axis, _, _ in self._compiled.entries), 0.0
+        )
+
+    def reset(self) -> None:
+        """Forget the previous frame so the next one is always remapped.
+
+        Call this when a stream restarts (new recording, sensor reconnect) so
+        its first frame is not flagged as a repeat of the old stream's last.
+        """
+
+        self._last_frame = None
+        self._repeated = False
 
     # ------------------------------------------------------------------
     # Construction helpers
@@ -65,29 +132,100 @@ class MappingPipeline:
         """Return the OSC address and flat argument list for a payload."""
 
         axes = payload.get("axes", {}) or {}
-        args: list[Any] = []
+        order = self._compiled.osc_order
+        if len(axes) == len(order):
+            # Usual case: exactly the compiled axes, already sorted at compile
+            # time, so we only slot the values in between the names.
+            try:
+                values = [float(axes[axis]) for axis in order]
+            except KeyError:
+                pass
+            else:
+                args: list[Any] = self._osc_template.copy()
+                args[1::2] = values
+                return self.osc_address, args
+        args = []
         for axis, value in sorted(axes.items()):
             args.extend([axis, float(value)])
         return self.osc_address, args
 
+    def prepare_osc_packet(self, payload: Mapping[str, Any]) -> Optional[bytes]:
+        """Return the encoded OSC datagram for ``payload``, or ``None``.
+
+        Only payloads carrying exactly the compiled axes have a pre-encoded
+        form; anything else goes through :meth:`prepare_osc_message`.
+        """
+
+        axes = payload.get("axes", {}) or {}
+        order = self._compiled.osc_order
+        if not order or len(axes) != len(order):
+            return None
+        try:
+            values = [axes[axis] for axis in order]
+        except KeyError:
+            return None
+        return self._osc_encoder.encode(values)
+
     def emit_osc(self, payload: Mapping[str, Any]) -> bool:
         """Send ``payload`` to the bound OSC client if present."""
 
         if self._osc_client is None:
             return False
+        packet = self.prepare_osc_packet(payload)
+        if packet is not None and send_datagram(self._osc_client, packet):
+            return True
         address, args = self.prepare_osc_message(payload)
         if not args:
             return False
         self._osc_client.send_message(address, args)
         return True
 
+    def flush_osc(self) -> None:
+        """Flush the bound client if it buffers (see :class:`roomlens.osc.OscBatcher`)."""
+
+        flush = getattr(self._osc_client, "flush", None)
+        if flush is not None:
+            flush()
+
     # ------------------------------------------------------------------
     # Core mapping behaviour
     # ------------------------------------------------------------------
+    @property
+    def last_frame_repeated(self) -> bool:
+        """``True`` if the last processed frame matched the one before it.
+
+        Only the timestamp differed, so the axes were reused rather than
+        recomputed. Hosts use this to skip re-sending identical OSC values.
+        """
+
+        return self._repeated
+
     def process_frame(self, frame: Mapping[str, Any]) -> Dict[str, Any]:
         """Translate a normalized frame into a timestamped axis payload."""
 
-        axes = apply_mapping(frame, self.mapping, processors=self.processors)
+        compiled = self._compiled
+        snapshot = None
+        if self.detect_repeats and not compiled.processors:
+            # Firmware prints features with three decimals, so a still room
+            # sends runs of identical frames. Comparing a shallow copy is far
+            # cheaper than remapping. Custom processors may depend on ``t``,
+            # so they always run.
+            snapshot = dict(frame)
+            snapshot.pop("t", None)
+            self._repeated = snapshot == self._last_frame
+        if self.reuse_axes and not compiled.processors:
+            # The buffer still holds the previous frame's axes on a repeat.
+            axes = self._axes_buf
+            if not self._repeated:
+                apply_mapping_into(frame, compiled, axes)
+                self._last_frame = snapshot
+        elif self._repeated:
+            axes = dict(self._last_axes)
+        else:
+            axes = apply_mapping(frame, compiled)
+            if snapshot is not None:
+                self._last_frame = snapshot
+                self._last_axes = dict(axes)
         payload: Dict[str, Any] = {
             "t": frame.get("t"),
             "axes": axes,
@@ -100,10 +238,20 @@ class MappingPipeline:
         for frame in frames:
             yield self.process_frame(frame)
 
-    def update_mapping(self, mapping: MutableMapping[str, Any]) -> None:
+    def process_batch(self, frames: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+        """Map a list of frames in one vectorized pass (requires NumPy).
+
+        Returns one array per axis, aligned with ``frames``; see
+        :func:`roomlens.apply_mapping_batch`. Handy for replays and notebook
+        analysis where every frame is already in memory.
+        """
+
+        return apply_mapping_batch(frames, self._compiled)
+
+    def update_mapping(self, mapping: MappingDict) -> None:
         """Swap in a new mapping dict at runtime."""
 
-        validate_mapping_axes(mapping)
+        # Assigning the field recompiles (see ``__setattr__``).
         self.mapping = mapping
 
     def reload_from_yaml(self, path: str | Path) -> None:
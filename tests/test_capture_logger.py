@@ -1,12 +1,16 @@
 import csv
 import io
+import sys
 
+import pytest
+
+from tools import capture_logger
 from tools.capture_logger import capture_stream
 
 
 def test_capture_stream_creates_csv_on_confirmation(tmp_path):
-    stdin = io.StringIO(
-        """
+    stdin = io.BytesIO(
+        b"""
 {"sensor": "imu", "value": 42}
 not json
 {"sensor": "imu", "value": 43}
@@ -18,23 +22,127 @@ not json
     confirmed = capture_stream(stdin, out_path, lambda _: True)
 
     assert confirmed is True
-    assert out_path.exists()
+    assert out_path.read_text().splitlines() == ["sensor,value", "imu,42", "imu,43"]
 
-    with out_path.open() as fh:
-        reader = csv.DictReader(fh)
-        rows = list(reader)
 
-    assert reader.fieldnames == ["sensor", "value"]
-    assert rows == [
-        {"sensor": "imu", "value": "42"},
-        {"sensor": "imu", "value": "43"},
+def test_capture_stream_joins_lines_split_across_reads(tmp_path, monkeypatch):
+    # Tiny reads force frames to straddle chunk boundaries; no trailing newline.
+    monkeypatch.setattr(capture_logger, "READ_CHUNK_BYTES", 7)
+    stdin = io.BufferedReader(
+        io.BytesIO(b'{"sensor": "imu", "value": 42}\n{"sensor": "imu", "value": 43}')
+    )
+    out_path = tmp_path / "capture.csv"
+
+    assert capture_stream(stdin, out_path, lambda _: True) is True
+
+    assert out_path.read_text().splitlines() == ["sensor,value", "imu,42", "imu,43"]
+
+
+def test_capture_stream_blanks_missing_columns(tmp_path):
+    stdin = io.BytesIO(b'{"a": 1, "b": "x,y"}\n{"b": 2}\n{"a": 3, "b": 4}\n')
+    out_path = tmp_path / "capture.csv"
+
+    assert capture_stream(stdin, out_path, lambda _: True) is True
+
+    assert out_path.read_text().splitlines() == ["a,b", '1,"x,y"', ",2", "3,4"]
+
+
+def test_capture_stream_rejects_columns_missing_from_header(tmp_path):
+    stdin = io.BytesIO(b'{"a": 1, "b": 2}\n{"a": 3, "c": 4}\n')
+
+    with pytest.raises(ValueError, match="'c'"):
+        capture_stream(stdin, tmp_path / "capture.csv", lambda _: True)
+
+
+def test_capture_stream_skips_firmware_events(tmp_path):
+    stdin = io.BytesIO(
+        b'{"event":"boot","device":"roomlens-teensy"}\n'
+        b'{"t":10,"mic_rms":0.125,"motion":0}\n'
+        b'{"t":50,"mic_rms":0.25,"motion":1}\n'
+    )
+    out_path = tmp_path / "capture.csv"
+
+    assert capture_stream(stdin, out_path, lambda _: True) is True
+
+    assert out_path.read_text().splitlines() == [
+        "t,mic_rms,motion",
+        "10,0.125,0",
+        "50,0.25,1",
     ]
 
 
+def test_capture_stream_ignores_lines_that_are_not_objects(tmp_path):
+    stdin = io.BytesIO(b'booting...\n\n42\n[1, 2]\n{"a": 1}\n{broken\n{"a": 2}\n')
+    out_path = tmp_path / "capture.csv"
+
+    assert capture_stream(stdin, out_path, lambda _: True) is True
+
+    assert out_path.read_text().splitlines() == ["a", "1", "2"]
+
+
 def test_capture_stream_skips_file_when_not_confirmed(tmp_path):
     out_path = tmp_path / "capture.csv"
 
-    confirmed = capture_stream(io.StringIO("{}"), out_path, lambda _: False)
+    confirmed = capture_stream(io.BytesIO(b"{}"), out_path, lambda _: False)
 
     assert confirmed is False
     assert not out_path.exists()
+
+
+def test_capture_stream_arrow_writes_same_rows(tmp_path):
+    pytest.importorskip("pyarrow")
+    stdin = io.BytesIO(b'{"sensor": "imu", "value": 42}\nnope\n{"sensor": "imu", "value": 43}\n')
+    out_path = tmp_path / "capture.csv"
+
+    assert capture_stream(stdin, out_path, lambda _: True, use_arrow=True) is True
+
+    with out_path.open() as fh:
+        rows = list(csv.DictReader(fh))
+    assert rows == [
+        {"sensor": "imu", "value": "42"},
+        {"sensor": "imu", "value": "43"},
+    ]
+
+
+def test_capture_stream_arrow_widens_types_across_batches(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    # The first batch sees only ints in "v" and only nulls in "w".
+    monkeypatch.setattr(capture_logger, "ARROW_BATCH_ROWS", 2)
+    stdin = io.BytesIO(
+        b'{"v": 1, "w": null}\n{"v": 2, "w": null}\n{"v": 0.5, "w": 3}\n{"v": 4.5, "w": "x"}\n'
+    )
+    out_path = tmp_path / "capture.csv"
+
+    assert capture_stream(stdin, out_path, lambda _: True, use_arrow=True) is True
+
+    with out_path.open() as fh:
+        rows = list(csv.DictReader(fh))
+    assert rows == [
+        {"v": "1", "w": ""},
+        {"v": "2", "w": ""},
+        {"v": "0.5", "w": "3"},
+        {"v": "4.5", "w": "x"},
+    ]
+
+
+def test_capture_stream_arrow_stringifies_nested_values(tmp_path):
+    pytest.importorskip("pyarrow")
+    stdin = io.BytesIO(b'{"id": 1, "meta": {"gain": 2}, "peaks": [1, 2]}\n')
+    arrow_path = tmp_path / "arrow.csv"
+    csv_path = tmp_path / "plain.csv"
+
+    assert capture_stream(stdin, arrow_path, lambda _: True, use_arrow=True) is True
+    stdin.seek(0)
+    assert capture_stream(stdin, csv_path, lambda _: True) is True
+
+    with arrow_path.open() as fh, csv_path.open() as plain:
+        assert list(csv.DictReader(fh)) == list(csv.DictReader(plain))
+
+
+def test_capture_stream_arrow_falls_back_without_pyarrow(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow.csv", None)
+    out_path = tmp_path / "capture.csv"
+
+    assert capture_stream(io.BytesIO(b'{"a": 1}\n'), out_path, lambda _: True, use_arrow=True)
+
+    assert out_path.read_text().splitlines() == ["a", "1"]
@@ -2,6 +2,11 @@
 from __future__ import annotations
 
 import argparse
+import io
+import os
+import queue
+import subprocess
+import sys
 from types import SimpleNamespace
 from typing import Any, Dict
 
@@ -16,6 +21,8 @@ def make_args(**overrides: Any) -> argparse.Namespace:
     defaults: Dict[str, Any] = {
         "mapping": "mapping.yaml",
         "osc": 0,
+        "osc_batch": 1,
+        "osc_bundle": False,
         "demo": False,
         "port": "auto",
         "baud": 115200,
@@ -25,6 +32,13 @@ def make_args(**overrides: Any) -> argparse.Namespace:
     return argparse.Namespace(**defaults)
 
 
+def _patch_app(monkeypatch: pytest.MonkeyPatch, **names: Any) -> None:
+    """Swap several ``host.python.app`` globals in one call."""
+
+    for name, value in names.items():
+        monkeypatch.setattr(app, name, value)
+
+
 @pytest.fixture
 def stubbed_pipeline(monkeypatch: pytest.MonkeyPatch) -> Dict[str, Any]:
     """Replace heavy mapping helpers with lightweight doubles."""
@@ -36,8 +50,9 @@ def stubbed_pipeline(monkeypatch: pytest.MonkeyPatch) -> Dict[str, Any]:
         return {"axes": {"demo": 1.0}}
 
     class DummyPipeline:
-        def __init__(self, mapping: Dict[str, Any]):
+        def __init__(self, mapping: Dict[str, Any], **kwargs: Any):
             self.mapping = mapping
+            self.kwargs = kwargs
             self.bound_client = None
             self.has_osc_client = False
             self.emitted = []
@@ -54,20 +69,17 @@ def stubbed_pipeline(monkeypatch: pytest.MonkeyPatch) -> Dict[str, Any]:
             self.emitted.append(payload)
             return True
 
-    monkeypatch.setattr(app, "load_mapping", fake_load_mapping)
-    monkeypatch.setattr(app, "MappingPipeline", DummyPipeline)
+    _patch_app(monkeypatch, load_mapping=fake_load_mapping, MappingPipeline=DummyPipeline)
     return captured
 
 
 def test_frame_iterator_uses_demo_when_serial_missing(monkeypatch: pytest.MonkeyPatch) -> None:
     """If pyserial is absent the CLI should fall back to demo frames."""
 
-    monkeypatch.setattr(app, "serial", None)
-
-    def fake_demo_frames():
+    def fake_demo_frames(on_idle=None):
         yield "demo"
 
-    monkeypatch.setattr(app, "demo_frames", fake_demo_frames)
+    _patch_app(monkeypatch, serial=None, demo_frames=fake_demo_frames)
 
     frames = app.frame_iterator(make_args())
     assert next(frames) == "demo"
@@ -76,16 +88,15 @@ def test_frame_iterator_uses_demo_when_serial_missing(monkeypatch: pytest.Monkey
 def test_frame_iterator_uses_demo_when_no_ports(monkeypatch: pytest.MonkeyPatch) -> None:
     """An empty USB roster should also land on the demo generator."""
 
-    monkeypatch.setattr(app, "serial", object())
-    monkeypatch.setattr(app, "find_serial", lambda: None)
-
     demo_calls = {"count": 0}
 
-    def fake_demo_frames():
+    def fake_demo_frames(on_idle=None):
         demo_calls["count"] += 1
         yield "fallback"
 
-    monkeypatch.setattr(app, "demo_frames", fake_demo_frames)
+    _patch_app(
+        monkeypatch, serial=object(), find_serial=lambda: None, demo_frames=fake_demo_frames
+    )
 
     frames = app.frame_iterator(make_args())
     assert next(frames) == "fallback"
@@ -95,16 +106,18 @@ def test_frame_iterator_uses_demo_when_no_ports(monkeypatch: pytest.MonkeyPatch)
 def test_frame_iterator_prefers_serial_when_available(monkeypatch: pytest.MonkeyPatch) -> None:
     """Once a port shows up the iterator should lean on hardware frames."""
 
-    monkeypatch.setattr(app, "serial", object())
-    monkeypatch.setattr(app, "find_serial", lambda: "/dev/ttyACM0")
-
     serial_calls: Dict[str, Any] = {}
 
-    def fake_serial_frames(port: str, baud: int):
+    def fake_serial_frames(port: str, baud: int, on_idle=None):
         serial_calls["args"] = (port, baud)
         yield {"source": "serial"}
 
-    monkeypatch.setattr(app, "serial_frames", fake_serial_frames)
+    _patch_app(
+        monkeypatch,
+        serial=object(),
+        find_serial=lambda: "/dev/ttyACM0",
+        serial_frames=fake_serial_frames,
+    )
 
     frames = app.frame_iterator(make_args())
     assert next(frames) == {"source": "serial"}
@@ -128,9 +141,7 @@ def test_setup_pipeline_binds_osc_when_requested(
         created_clients.append(client)
         return client
 
-    monkeypatch.setattr(
-        app, "udp_client", SimpleNamespace(SimpleUDPClient=fake_simple_udp_client)
-    )
+    _patch_app(monkeypatch, udp_client=SimpleNamespace(SimpleUDPClient=fake_simple_udp_client))
 
     args = make_args(osc=9000)
     pipeline = app.setup_pipeline(args)
@@ -153,11 +164,137 @@ def test_setup_pipeline_skips_osc_when_disabled(
         calls.append((host, port))
         raise AssertionError("SimpleUDPClient should not be constructed")
 
-    monkeypatch.setattr(
-        app, "udp_client", SimpleNamespace(SimpleUDPClient=fake_simple_udp_client)
-    )
+    _patch_app(monkeypatch, udp_client=SimpleNamespace(SimpleUDPClient=fake_simple_udp_client))
 
     pipeline = app.setup_pipeline(make_args())
 
     assert pipeline.has_osc_client is False
     assert calls == []
+
+
+def test_setup_pipeline_skips_yaml_for_json_mappings(
+    monkeypatch: pytest.MonkeyPatch,
+    stubbed_pipeline: Dict[str, Any],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A .json mapping should not import PyYAML just to report its loader."""
+
+    def fail() -> None:
+        raise AssertionError("yaml_loader should not be consulted")
+
+    _patch_app(monkeypatch, yaml_loader=fail)
+
+    app.setup_pipeline(make_args(mapping="mapping.json"))
+
+    assert stubbed_pipeline["path"].name == "mapping.json"
+    assert "YAML loader" not in capsys.readouterr().err
+
+
+class FakeSerialPort(io.RawIOBase):
+    """Pretend USB serial port that dribbles out pre-baked byte chunks."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = list(chunks)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        # An empty chunk mimics a read timeout with nothing on the wire.
+        data = self.chunks.pop(0) if self.chunks else b""
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def test_serial_frames_reassembles_split_lines(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Frames split across reads (and junk lines) should still parse cleanly."""
+
+    port = FakeSerialPort(
+        [b'{"mic_rms": 0.1}\n{"mic_', b"", b'rms": 0.2}\nboot banner\n{"lux": 1}\n']
+    )
+    _patch_app(monkeypatch, serial=SimpleNamespace(Serial=lambda *_args, **_kwargs: port))
+
+    frames = app.serial_frames("/dev/ttyACM0", 115200)
+    assert [next(frames) for _ in range(3)] == [
+        {"mic_rms": 0.1},
+        {"mic_rms": 0.2},
+        {"lux": 1},
+    ]
+
+
+def test_serial_frames_reads_selectable_ports(monkeypatch: pytest.MonkeyPatch) -> None:
+    """POSIX ports are drained via select + os.read until the device goes away."""
+
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b'{"tof_near": 0.5}\n{"tof_')
+    os.write(write_fd, b'near": 0.6}\n\n{"tof_near": 0.7}\n')
+    os.close(write_fd)
+
+    class PipeSerial:
+        def fileno(self) -> int:
+            return read_fd
+
+        def close(self) -> None:
+            os.close(read_fd)
+
+    _patch_app(monkeypatch, serial=SimpleNamespace(Serial=lambda *_args, **_kwargs: PipeSerial()))
+
+    idle_calls = []
+    frames = list(
+        app.serial_frames("/dev/ttyACM0", 115200, on_idle=lambda: idle_calls.append(1))
+    )
+    assert frames == [{"tof_near": 0.5}, {"tof_near": 0.6}, {"tof_near": 0.7}]
+    assert idle_calls  # the queue ran dry at least once
+
+
+def test_demo_frames_go_idle_before_each_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Buffered output is pushed out before the demo waits for its next frame."""
+
+    events = []
+    monkeypatch.setattr(app.time, "sleep", lambda _s: events.append("sleep"))
+
+    frames = app.demo_frames(on_idle=lambda: events.append("idle"))
+    for _ in range(3):
+        next(frames)
+        events.append("frame")
+    assert events[:5] == ["frame", "idle", "sleep", "frame", "idle"]
+
+
+def test_demo_frames_resync_after_stall(monkeypatch: pytest.MonkeyPatch) -> None:
+    """After a long stall the demo resumes its cadence instead of bursting."""
+
+    clock = [0.0]
+    sleeps = []
+    monkeypatch.setattr(app.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(app.time, "sleep", sleeps.append)
+
+    frames = app.demo_frames()
+    next(frames)
+    clock[0] = 5.0  # the consumer stalled for five seconds
+    next(frames)
+    next(frames)
+    assert sleeps == [pytest.approx(app.DEMO_FRAME_SECONDS)]
+
+
+def test_offer_drops_oldest_frame_when_full() -> None:
+    """A slow consumer should see the freshest frames, not a stale backlog."""
+
+    frames: "queue.Queue[int]" = queue.Queue(maxsize=2)
+    for n in (1, 2, 3):
+        app._offer(frames, n)
+
+    assert [frames.get_nowait(), frames.get_nowait()] == [2, 3]
+
+
+def test_import_defers_optional_dependencies():
+    """``--help`` and demo runs should not pay for pyserial, python-osc, PyYAML, or Numba."""
+
+    code = (
+        "import sys, host.python.app; "
+        "print(sorted(m for m in ('serial', 'pythonosc', 'yaml', 'numba') if m in sys.modules))"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "[]"
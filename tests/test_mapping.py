@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import json
+import sys
+from pathlib import Path
+
 import pytest
 
 from roomlens import mapping
+from roomlens.demo import demo_frame, demo_frames
+
+MAPPING_PATH = Path(__file__).resolve().parents[1] / "config" / "mapping.default.yaml"
 
 
 def _build_mapping(transform: str | None = None):
@@ -56,6 +63,18 @@ def test_unknown_transform_raises_value_error():
         mapping.apply_mapping({"mic_rms": 0.2}, mapping_cfg)
 
 
+def test_nan_features_clamp_to_range_floor():
+    mapping_cfg = _build_mapping()
+    mapping_cfg["sensors"]["mic"]["features"]["rms"]["map_to"]["range"] = [2.0, 4.0]
+    frame = {"mic_rms": float("nan")}
+
+    assert mapping.clamp01(float("nan")) == 0.0
+    assert mapping.apply_mapping(frame, mapping_cfg) == {"demo": 2.0}
+    assert mapping.apply_mapping(frame, mapping.compile_mapping(mapping_cfg)) == {"demo": 2.0}
+    pytest.importorskip("numpy")
+    assert mapping.apply_mapping_batch([frame], mapping_cfg)["demo"].tolist() == [2.0]
+
+
 def test_source_field_prefers_first_available_key():
     mapping_cfg = {
         "sensors": {
@@ -73,3 +92,255 @@ def test_source_field_prefers_first_available_key():
     frame = {"fallback": 0.8}
     axes = mapping.apply_mapping(frame, mapping_cfg)
     assert axes["demo"] == pytest.approx(0.8)
+
+
+def test_load_mapping_returns_independent_copies(tmp_path):
+    path = tmp_path / "mapping.yaml"
+    path.write_text("sensors: {}\naxes: {demo: {label: Demo}}\n", encoding="utf-8")
+
+    first = mapping.load_mapping(path)
+    first["axes"]["demo"]["label"] = "mutated"
+    second = mapping.load_mapping(path)
+
+    assert second["axes"]["demo"]["label"] == "Demo"
+
+
+def test_load_mapping_notices_file_edits(tmp_path):
+    path = tmp_path / "mapping.yaml"
+    path.write_text("version: 1\n", encoding="utf-8")
+    assert mapping.load_mapping(path)["version"] == 1
+
+    path.write_text("version: 22\n", encoding="utf-8")
+    assert mapping.load_mapping(path)["version"] == 22
+
+
+def test_load_mapping_dispatches_on_suffix(tmp_path):
+    expected = mapping.load_mapping(MAPPING_PATH)
+    json_path = tmp_path / "mapping.json"
+    json_path.write_text(json.dumps(expected), encoding="utf-8")
+    assert mapping.load_mapping(json_path) == expected
+
+    toml_path = tmp_path / "mapping.toml"
+    toml_path.write_text(
+        '[sensors.mic]\nenabled = true\n'
+        '[sensors.mic.features.rms]\ntransform = "log10_clamp(floor_db=-50)"\n'
+        '[sensors.mic.features.rms.map_to]\naxis = "demo"\nrange = [0.0, 2.0]\n',
+        encoding="utf-8",
+    )
+    assert mapping.load_mapping(toml_path) == {
+        "sensors": {
+            "mic": {
+                "enabled": True,
+                "features": {
+                    "rms": {
+                        "transform": "log10_clamp(floor_db=-50)",
+                        "map_to": {"axis": "demo", "range": [0.0, 2.0]},
+                    }
+                },
+            }
+        }
+    }
+
+
+def test_compiled_mapping_matches_dict_walk():
+    mapping_cfg = mapping.load_mapping(MAPPING_PATH)
+    compiled = mapping.compile_mapping(mapping_cfg)
+    for t in (0.0, 0.5, 3.25, 17.0):
+        frame = demo_frame(t)
+        assert mapping.apply_mapping(frame, compiled) == mapping.apply_mapping(
+            frame, mapping_cfg
+        )
+
+
+@pytest.mark.parametrize(
+    "sensor, feature, cfg",
+    [
+        ("mic", "rms", {}),
+        ("mic", "rms", {"frame_key": "lux"}),
+        ("mic", "rms", {"source": "primary | fallback"}),
+        ("mic", "rms", {"source": ["nope", 3, "fallback"]}),
+        ("tof", "proximity", {"source": "missing"}),
+        ("custom", "level", {}),
+        ("custom", "level", {"source": "|"}),
+    ],
+)
+def test_compiled_resolvers_follow_lookup_order(sensor, feature, cfg):
+    resolver = mapping._compile_resolver(sensor, feature, cfg)
+    frames = [
+        {},
+        {"mic_rms": 0.1, "tof_near": 0.2, "lux": 0.3},
+        {"primary": 0.4, "fallback": 0.5, "custom_level": 0.6, "level": 0.7},
+        {"fallback": 0.5, "level": 0.7, "|": 0.9},
+    ]
+    for frame in frames:
+        assert resolver(frame) == mapping._resolve_feature_value(sensor, feature, cfg, frame)
+
+
+def test_compile_mapping_validate_reports_missing_axes():
+    mapping_cfg = {
+        "sensors": {
+            "mic": {"enabled": True, "features": {"rms": {"map_to": {}}}},
+            "tof": {"enabled": False, "features": {"proximity": {}}},
+        }
+    }
+    assert mapping.compile_mapping(mapping_cfg).entries == []
+    with pytest.raises(ValueError, match="mic.rms, tof.proximity"):
+        mapping.compile_mapping(mapping_cfg, validate=True)
+
+
+def test_fused_kernel_matches_entry_loop():
+    from roomlens._mapping_core import map_entries
+
+    mapping_cfg = mapping.load_mapping(MAPPING_PATH)
+    mapping_cfg["sensors"]["mic"]["features"]["rms"]["map_to"]["range"] = [
+        float("-inf"),
+        0.0,
+    ]
+    compiled = mapping.compile_mapping(mapping_cfg)
+    kernel = mapping._fuse_entries(compiled.entries)
+    for t in (0.0, 0.5, 3.25, 17.0):
+        frame = demo_frame(t)
+        expected: dict[str, float] = {}
+        map_entries(frame, compiled.entries, expected)
+        got: dict[str, float] = {}
+        kernel(frame, got)
+        assert got == pytest.approx(expected, nan_ok=True)
+        assert list(got) == list(expected)
+
+
+def test_generic_sensor_processor_matches_compiled_path():
+    mapping_cfg = mapping.load_mapping(MAPPING_PATH)
+    compiled = mapping.compile_mapping(mapping_cfg)
+    frame = demo_frame(3.25)
+    axes: dict[str, float] = {}
+    for sensor_name, sensor_cfg in mapping_cfg["sensors"].items():
+        if sensor_cfg.get("enabled", False):
+            mapping._process_generic_sensor(sensor_name, frame, sensor_cfg, axes)
+
+    assert axes == mapping.apply_mapping(frame, compiled)
+
+
+def test_compile_mapping_keeps_custom_processors():
+    def loud(sensor_name, frame, sensor_cfg, axes):
+        axes["demo"] = 99.0
+
+    compiled = mapping.compile_mapping(_build_mapping(), processors={"mic": loud})
+    assert compiled.entries == []
+    assert mapping.apply_mapping({"mic_rms": 0.2}, compiled) == {"demo": 99.0}
+
+
+@pytest.mark.parametrize(
+    "motion, attack_ms",
+    [(None, 80.0), (0, 80.0), (False, 80.0), (0.3, 5.0), (-1, 5.0), (True, 5.0)],
+)
+def test_motion_burst_is_a_truthiness_flag(motion, attack_ms):
+    """Raw PIR levels, bools, and nulls all collapse to motion / no motion."""
+
+    cfg = mapping.load_mapping(MAPPING_PATH)
+    frame = {"motion": motion}
+    assert mapping.apply_mapping(frame, cfg)["env_attack_ms"] == attack_ms
+    assert mapping.apply_mapping(frame, mapping.compile_mapping(cfg))["env_attack_ms"] == attack_ms
+
+
+def test_apply_mapping_with_processors_does_not_compile(monkeypatch):
+    """Per-frame calls on a plain dict must not generate a kernel each time."""
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("one-off apply_mapping should walk the dict")
+
+    cfg = mapping.load_mapping(MAPPING_PATH)
+    frame = demo_frame(0.5)
+
+    def loud(sensor_name, frame, sensor_cfg, axes):
+        axes["grain_density"] = 99.0
+
+    expected = mapping.apply_mapping(frame, mapping.compile_mapping(cfg, processors={"mic": loud}))
+    monkeypatch.setattr(mapping, "compile_mapping", fail)
+    monkeypatch.setattr(mapping, "_fuse_entries", fail)
+    assert mapping.apply_mapping(frame, cfg, processors={"mic": loud}) == expected
+    assert expected["grain_density"] == 99.0
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        "identity",
+        "clamp01",
+        "log10_clamp(floor_db=-50)",
+        "softclip(0.7, slope=3)",
+        "softclip(1.0)",
+        "inverse_exp(centers=[0.5, 2.0], k=1.5)",
+    ],
+)
+def test_vectorized_transforms_match_scalar(spec):
+    np = pytest.importorskip("numpy")
+
+    transform = mapping._resolve_transform({"transform": spec})
+    xs = [-1.0, 0.0, 1e-4, 0.05, 0.3, 0.7, 0.75, 1.0, 1.5, 3.0]
+    got = transform.vectorized(np.array(xs))
+    assert got.tolist() == pytest.approx([transform(x) for x in xs])
+
+
+@pytest.mark.parametrize(
+    "kernel, args, spec",
+    [
+        ("_log10_clamp_kernel", (-50.0,), "log10_clamp(floor_db=-50)"),
+        ("_softclip_kernel", (0.7, 3.0), "softclip(0.7, slope=3)"),
+        ("_inverse_exp_kernel", ([0.5, 2.0], 1.5), "inverse_exp(centers=[0.5, 2.0], k=1.5)"),
+    ],
+)
+def test_batch_kernels_match_scalar(kernel, args, spec):
+    """The Numba kernels (plain loops without Numba) trace the scalar curves."""
+
+    np = pytest.importorskip("numpy")
+
+    transform = mapping._resolve_transform({"transform": spec})
+    xs = np.array([-1.0, 0.0, 1e-4, 0.05, 0.3, 0.7, 0.75, 1.0, 1.5, 3.0])
+    if kernel == "_inverse_exp_kernel":
+        args = (np.array(args[0]), args[1])
+    out = np.empty_like(xs)
+    getattr(mapping, kernel)(xs, out, *args)
+    assert out.tolist() == pytest.approx([transform(x) for x in xs.tolist()])
+
+
+def test_lazy_jit_falls_back_to_python_on_first_call(monkeypatch):
+    """With Numba missing or broken the first call quietly runs the plain function."""
+
+    from roomlens import _jit
+
+    monkeypatch.setattr(_jit, "HAVE_NUMBA", True)
+    monkeypatch.setitem(sys.modules, "numba", None)
+
+    @_jit.njit(cache=True)
+    def double(x):
+        return 2.0 * x
+
+    assert double.__name__ == "double"
+    assert double(2.0) == 4.0
+    assert double(3.0) == 6.0
+
+
+def test_apply_mapping_batch_matches_per_frame():
+    np = pytest.importorskip("numpy")
+
+    compiled = mapping.compile_mapping(mapping.load_mapping(MAPPING_PATH))
+    frames = [demo_frame(t * 0.25) for t in range(64)]
+    columns = mapping.apply_mapping_batch(frames, compiled)
+
+    for i, frame in enumerate(frames):
+        for axis, value in mapping.apply_mapping(frame, compiled).items():
+            assert columns[axis][i] == pytest.approx(value)
+    assert all(isinstance(col, np.ndarray) for col in columns.values())
+
+
+def test_demo_frames_match_scalar_demo_frame():
+    np = pytest.importorskip("numpy")
+
+    ts = np.array([0.0, 0.25, 3.5, 17.0])
+    columns = demo_frames(ts)
+    assert columns["t"].tolist() == [0, 250, 3500, 17000]
+    for i, t in enumerate(ts.tolist()):
+        frame = demo_frame(t)
+        for key, value in frame.items():
+            if key != "t":
+                assert columns[key][i] == pytest.approx(value)
@@ -0,0 +1,150 @@
+"""Tests for the OSC output helpers."""
+from __future__ import annotations
+
+import socket
+from typing import List
+
+import pytest
+
+from roomlens.osc import OscAxesEncoder, OscBatcher, send_datagram, send_datagrams
+
+pytest.importorskip("pythonosc")
+from pythonosc.osc_bundle import OscBundle  # noqa: E402
+from pythonosc.osc_message import OscMessage  # noqa: E402
+from pythonosc.osc_message_builder import OscMessageBuilder  # noqa: E402
+
+
+class FakeSocket:
+    def __init__(self) -> None:
+        self.sent: List[tuple[bytes, tuple[str, int]]] = []
+
+    def sendto(self, data: bytes, address: tuple[str, int]) -> None:
+        self.sent.append((data, address))
+
+
+class FakeUDPClient:
+    """Mimics the attributes python-osc's UDPClient keeps for its socket."""
+
+    def __init__(self) -> None:
+        self._sock = FakeSocket()
+        self._address = "127.0.0.1"
+        self._port = 57120
+
+    @property
+    def datagrams(self) -> List[bytes]:
+        return [data for data, _ in self._sock.sent]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_axes_encoder_matches_python_osc():
+    encoder = OscAxesEncoder("/roomlens", ["delay_time_ms", "fm_index", "mix"])
+    builder = OscMessageBuilder(address="/roomlens")
+    for axis, value in (("delay_time_ms", 90.0), ("fm_index", 1.05), ("mix", 0.5)):
+        builder.add_arg(axis)
+        builder.add_arg(value)
+
+    assert encoder.encode([90.0, 1.05, 0.5]) == builder.build().dgram
+
+
+def test_send_datagram_uses_client_socket():
+    client = FakeUDPClient()
+    assert send_datagram(client, b"abcd") is True
+    assert client._sock.sent == [(b"abcd", ("127.0.0.1", 57120))]
+    assert send_datagram(object(), b"abcd") is False
+
+
+def test_batcher_sends_lone_stale_message_immediately():
+    client = FakeUDPClient()
+    batcher = OscBatcher(client, max_messages=16, max_delay=0.0, clock=FakeClock())
+
+    batcher.send_message("/roomlens", ["grain_density", 0.2])
+
+    (datagram,) = client.datagrams
+    msg = OscMessage(datagram)
+    assert msg.address == "/roomlens"
+    assert msg.params == ["grain_density", pytest.approx(0.2)]
+
+
+def test_batcher_sends_steady_stream_frame_by_frame():
+    clock = FakeClock()
+    client = FakeUDPClient()
+    batcher = OscBatcher(client, max_messages=16, clock=clock)
+    encoder = OscAxesEncoder("/roomlens", ["mix"])
+
+    for n in range(1, 6):
+        batcher.send_datagram(encoder.encode([n / 10]))
+        assert len(client.datagrams) == n
+        clock.now += 0.04  # 25 Hz demo cadence
+
+
+def test_batcher_sends_bursts_as_separate_datagrams():
+    client = FakeUDPClient()
+    batcher = OscBatcher(client, max_messages=3, max_delay=1.0, clock=FakeClock())
+
+    # The first message goes straight out; the burst behind it is queued.
+    for value in (0.0, 0.1, 0.2):
+        batcher.send_message("/roomlens", ["grain_density", value])
+    assert len(client.datagrams) == 1
+    batcher.send_message("/roomlens", ["grain_density", 0.3])
+
+    assert [OscMessage(d).params for d in client.datagrams] == [
+        ["grain_density", pytest.approx(v)] for v in (0.0, 0.1, 0.2, 0.3)
+    ]
+
+
+def test_batcher_bundles_bursts_on_request():
+    client = FakeUDPClient()
+    batcher = OscBatcher(client, max_messages=3, max_delay=1.0, clock=FakeClock(), bundle=True)
+
+    for value in (0.0, 0.1, 0.2, 0.3):
+        batcher.send_message("/roomlens", ["grain_density", value])
+
+    lead, datagram = client.datagrams
+    assert OscMessage(lead).params == ["grain_density", pytest.approx(0.0)]
+    bundle = OscBundle(datagram)
+    assert [msg.params for msg in bundle] == [
+        ["grain_density", pytest.approx(v)] for v in (0.1, 0.2, 0.3)
+    ]
+
+
+def test_batcher_flush_drains_partial_batch():
+    client = FakeUDPClient()
+    batcher = OscBatcher(client, max_messages=8, max_delay=1.0, clock=FakeClock())
+    encoder = OscAxesEncoder("/roomlens", ["reverb_mix"])
+
+    batcher.send_datagram(encoder.encode([0.2]))
+    batcher.send_datagram(encoder.encode([0.3]))
+    assert len(client.datagrams) == 1
+    batcher.flush()
+    batcher.flush()
+
+    assert [OscMessage(d).params for d in client.datagrams] == [
+        ["reverb_mix", pytest.approx(v)] for v in (0.2, 0.3)
+    ]
+
+
+def test_send_datagrams_over_real_socket():
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(1.0)
+    client = FakeUDPClient()
+    client._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    client._port = receiver.getsockname()[1]
+    encoder = OscAxesEncoder("/roomlens", ["mix"])
+    # More than one sendmmsg call's worth, to cover the chunking.
+    values = [i / 100 for i in range(70)]
+    try:
+        assert send_datagrams(client, [encoder.encode([v]) for v in values]) is True
+        received = [OscMessage(receiver.recv(512)).params[1] for _ in values]
+    finally:
+        receiver.close()
+        client._sock.close()
+
+    assert received == pytest.approx(values)
@@ -12,8 +12,16 @@ MAPPING_PATH = ROOT / "config" / "mapping.default.yaml"
 
 
 class MappingTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Parsed once for the class; no test mutates the mapping dict.
+        cls.mapping = load_mapping(MAPPING_PATH)
+        cls.pipeline = MappingPipeline(cls.mapping)
+
     def setUp(self) -> None:
-        self.mapping = load_mapping(MAPPING_PATH)
+        # The shared pipeline is compiled once; only per-test state is reset.
+        self.pipeline.reset()
+        self.pipeline.bind_osc_client(None)
 
     def test_mapping_validates(self) -> None:
         """The default mapping should declare axes for every feature."""
@@ -22,42 +30,108 @@ class MappingTests(unittest.TestCase):
         validate_mapping_axes(self.mapping)
 
     def test_apply_mapping_known_values(self) -> None:
-        """Explicit frame values hit the expected axis ranges."""
+        """Explicit frame values hit the expected axis ranges.
 
-        frame = {
+        Without ``distance_cm`` the proximity feature falls back to the
+        ``tof_near`` fraction, which widens the pitch cluster.
+        """
+
+        base = {
             "mic_rms": 1.0,
             "mic_sc": 0.0,
             "hf": 0.0,
             "tof_motion": 0.5,
             "tof_near": 0.5,
-            "distance_cm": 28.0,
             "lux": 1.0,
             "flicker": 0.0,
             "motion": 1,
         }
-        axes = apply_mapping(frame, self.mapping)
-        self.assertAlmostEqual(axes["grain_density"], 0.45, places=6)
-        self.assertAlmostEqual(axes["filter_cutoff_hz"], 400.0, places=6)
-        self.assertAlmostEqual(axes["distortion_drive"], 0.0, places=6)
-        self.assertAlmostEqual(axes["fm_index"], 1.05, places=6)
-        self.assertAlmostEqual(axes["pitch_cluster_width_cents"], 354.09416, places=5)
-        self.assertAlmostEqual(axes["reverb_mix"], 0.35, places=6)
-        self.assertAlmostEqual(axes["delay_time_ms"], 90.0, places=6)
-        self.assertAlmostEqual(axes["env_attack_ms"], 5.0, places=6)
+        cases = (
+            ({**base, "distance_cm": 28.0}, 354.09416),
+            (base, 487.36301),
+        )
+        for frame, cluster_width in cases:
+            with self.subTest(distance_cm=frame.get("distance_cm")):
+                axes = apply_mapping(frame, self.mapping)
+                self.assertAlmostEqual(axes["grain_density"], 0.45, places=6)
+                self.assertAlmostEqual(axes["filter_cutoff_hz"], 400.0, places=6)
+                self.assertAlmostEqual(axes["distortion_drive"], 0.0, places=6)
+                self.assertAlmostEqual(axes["fm_index"], 1.05, places=6)
+                self.assertAlmostEqual(axes["pitch_cluster_width_cents"], cluster_width, places=5)
+                self.assertAlmostEqual(axes["reverb_mix"], 0.35, places=6)
+                self.assertAlmostEqual(axes["delay_time_ms"], 90.0, places=6)
+                self.assertAlmostEqual(axes["env_attack_ms"], 5.0, places=6)
 
     def test_pipeline_payload_matches_apply_mapping(self) -> None:
         """MappingPipeline should mirror :func:`apply_mapping`."""
 
-        pipeline = MappingPipeline(self.mapping)
+        pipeline = self.pipeline
         frame = demo_frame(0.5)
         payload = pipeline.process_frame(frame)
         self.assertIn("axes", payload)
         self.assertEqual(payload["axes"], apply_mapping(frame, self.mapping))
 
+    def test_repeated_frames_reuse_axes(self) -> None:
+        """Frames that only differ by timestamp are flagged and reuse axes."""
+
+        pipeline = MappingPipeline(self.mapping, detect_repeats=True)
+        frame = demo_frame(0.5)
+        first = pipeline.process_frame({**frame, "t": 1})
+        self.assertFalse(pipeline.last_frame_repeated)
+
+        second = pipeline.process_frame({**frame, "t": 2})
+        self.assertTrue(pipeline.last_frame_repeated)
+        self.assertEqual(second, {"t": 2, "axes": first["axes"]})
+        self.assertIsNot(second["axes"], first["axes"])
+
+        pipeline.process_frame({**frame, "mic_rms": 0.9, "t": 3})
+        self.assertFalse(pipeline.last_frame_repeated)
+
+    def test_reuse_axes_recycles_one_dict(self) -> None:
+        """reuse_axes trades fresh dicts for a single buffer with equal values."""
+
+        pipeline = MappingPipeline(self.mapping, reuse_axes=True)
+        first = pipeline.process_frame(demo_frame(0.5))
+        self.assertEqual(first["axes"], apply_mapping(demo_frame(0.5), self.mapping))
+
+        second = pipeline.process_frame(demo_frame(1.5))
+        self.assertIs(second["axes"], first["axes"])
+        self.assertEqual(second["axes"], apply_mapping(demo_frame(1.5), self.mapping))
+
+    def test_repeats_not_detected_by_default(self) -> None:
+        """Without detect_repeats every frame is remapped."""
+
+        frame = demo_frame(0.5)
+        self.pipeline.process_frame({**frame, "t": 1})
+        self.pipeline.process_frame({**frame, "t": 2})
+        self.assertFalse(self.pipeline.last_frame_repeated)
+
+    def test_toggling_reuse_axes_drops_repeat_memo(self) -> None:
+        """A repeat after switching reuse_axes off must not return stale axes."""
+
+        pipeline = MappingPipeline(self.mapping, reuse_axes=True, detect_repeats=True)
+        pipeline.process_frame(demo_frame(0.5))
+        frame = demo_frame(1.5)
+        pipeline.process_frame(frame)
+        pipeline.reuse_axes = False
+        payload = pipeline.process_frame(frame)
+        self.assertFalse(pipeline.last_frame_repeated)
+        self.assertEqual(payload["axes"], apply_mapping(frame, self.mapping))
+
+    def test_assigning_mapping_recompiles(self) -> None:
+        """Setting ``pipeline.mapping`` directly takes effect on the next frame."""
+
+        pipeline = MappingPipeline(self.mapping)
+        mapping = json.loads(json.dumps(self.mapping))
+        mapping["sensors"]["mic"]["features"]["rms"]["map_to"]["range"] = [0.25, 0.25]
+        pipeline.mapping = mapping
+        payload = pipeline.process_frame(demo_frame(0.5))
+        self.assertAlmostEqual(payload["axes"]["grain_density"], 0.25, places=6)
+
     def test_prepare_osc_message_orders_axes(self) -> None:
         """OSC message payload should be deterministic for tests/hosts."""
 
-        pipeline = MappingPipeline(self.mapping)
+        pipeline = self.pipeline
         frame = {
             "mic_rms": 0.2,
             "mic_sc": 0.7,
@@ -77,10 +151,17 @@ class MappingTests(unittest.TestCase):
         # Values should serialize cleanly to JSON numbers (regression check).
         json.dumps(args)
 
+    def test_prepare_osc_message_sorts_unknown_axes(self) -> None:
+        """Payloads that stray from the compiled axes still come out sorted."""
+
+        pipeline = self.pipeline
+        _, args = pipeline.prepare_osc_message({"axes": {"zeta": 1, "alpha": 0.5}})
+        self.assertEqual(args, ["alpha", 0.5, "zeta", 1.0])
+
     def test_emit_osc_sends_sorted_axes(self) -> None:
         """emit_osc should forward the prepared OSC payload to the client."""
 
-        pipeline = MappingPipeline(load_mapping(MAPPING_PATH))
+        pipeline = self.pipeline
 
         class StubClient:
             def __init__(self) -> None:
@@ -97,10 +178,37 @@ class MappingTests(unittest.TestCase):
         self.assertTrue(pipeline.emit_osc(payload))
         self.assertEqual(osc_client.messages, [expected_message])
 
+    def test_emit_osc_prefers_raw_datagrams(self) -> None:
+        """Socket-backed clients get the pre-encoded packet, not send_message."""
+
+        pipeline = self.pipeline
+
+        class SocketClient:
+            _address = "127.0.0.1"
+            _port = 57120
+
+            def __init__(self) -> None:
+                self.sent: list[bytes] = []
+                self._sock = self
+
+            def sendto(self, data: bytes, address: tuple[str, int]) -> None:
+                self.sent.append(data)
+
+            def send_message(self, address: str, args: list[float]) -> None:
+                raise AssertionError("raw path should have been used")
+
+        osc_client = SocketClient()
+        pipeline.bind_osc_client(osc_client)
+        payload = pipeline.process_frame(demo_frame(0.5))
+
+        self.assertTrue(pipeline.emit_osc(payload))
+        self.assertEqual(osc_client.sent, [pipeline.prepare_osc_packet(payload)])
+        self.assertTrue(osc_client.sent[0].startswith(b"/roomlens\x00"))
+
     def test_emit_osc_no_axes_short_circuits(self) -> None:
         """emit_osc should bail when there are no axes to send."""
 
-        pipeline = MappingPipeline(load_mapping(MAPPING_PATH))
+        pipeline = self.pipeline
 
         class StubClient:
             def __init__(self) -> None:
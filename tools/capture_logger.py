@@ -8,36 +8,225 @@ AFTER explicit confirmation. Use for short study captures.
 
 Usage:
   python tools/capture_logger.py --file data/capture.csv
+  python tools/capture_logger.py --file data/capture.csv --arrow   # pyarrow batches
 """
 import argparse
 import csv
-import json
 import sys
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - stdlib json works, just slower
+    from json import loads as _loads
 
-def capture_stream(stdin, out_path, confirm_callback):
-    """Capture JSON rows from *stdin* and persist them to *out_path* as CSV."""
+# Rows written between explicit flushes. Buffered writes keep a fast stream
+# off the write(2) syscall path; the periodic flush bounds what a crash or
+# yanked cable can lose.
+FLUSH_EVERY_ROWS = 256
+
+
+# Rows per RecordBatch when writing through pyarrow (see ``use_arrow``).
+ARROW_BATCH_ROWS = 1024
+
+# Bytes requested per read from a binary stdin; see ``_iter_lines``.
+READ_CHUNK_BYTES = 1 << 16
+
+
+def _iter_lines(stdin):
+    """Yield the lines of *stdin* (JSON parsers ignore any trailing newline).
+
+    Binary streams are read with ``read1`` in ``READ_CHUNK_BYTES`` pieces and
+    split on ``b"\\n"`` in C, which takes fewer syscalls than line iteration
+    over the 8 KiB default buffer. ``read1`` returns whatever is available,
+    so a live sensor pipe is never held back waiting for a full chunk. Text
+    streams have no ``read1`` and are iterated line by line.
+    """
+
+    read1 = getattr(stdin, "read1", None)
+    if read1 is None:
+        yield from stdin
+        return
+    tail = b""
+    while True:
+        chunk = read1(READ_CHUNK_BYTES)
+        if not chunk:
+            break
+        lines = (tail + chunk).split(b"\n")
+        # The last piece is a partial line (or b"" after a newline).
+        tail = lines.pop()
+        yield from lines
+    if tail:
+        yield tail
+
+
+def _iter_rows(stdin):
+    """Yield each JSON frame in *stdin*, skipping lines that do not parse.
+
+    Frames are JSON objects, so anything not starting with ``{`` (boot
+    banners, blank lines, stray numbers) is dropped with a one-byte check
+    instead of a parser call and a raised exception. Status objects carrying
+    an ``"event"`` key (the firmware prints ``{"event": "boot", ...}`` on
+    start-up) are skipped too: they are not frames, and as the first row
+    they would fix the CSV columns to their own keys.
+    """
+
+    for line in _iter_lines(stdin):
+        if line[:1] not in (b"{", "{"):
+            continue
+        try:
+            row = _loads(line)
+        except ValueError:  # json.JSONDecodeError and orjson's both subclass it
+            continue
+        if "event" in row:
+            continue
+        yield row
+
+
+def _check_columns(row, fieldnames):
+    """Raise ``ValueError`` if *row* has keys outside the header, like DictWriter."""
+
+    extra = [key for key in row if key not in fieldnames]
+    if extra:
+        raise ValueError(
+            "frame contains fields not in the CSV header "
+            f"{list(fieldnames)!r}: {', '.join(map(repr, extra))}"
+        )
+
+
+def _arrow_column(pa, values):
+    """Build one column, inferring its type from this batch alone."""
+
+    try:
+        column = pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        column = None
+    if column is None or pa.types.is_nested(column.type):
+        # Mixed strings and numbers, or dicts/lists the CSV writer cannot
+        # encode: write every cell as text, as csv would.
+        column = pa.array([None if v is None else str(v) for v in values], type=pa.string())
+    return column
+
+
+def _write_arrow(rows, out_path, batch_size):
+    """Write *rows* with pyarrow's CSV writer, one RecordBatch at a time.
+
+    The first frame fixes the column names, just like the stdlib path, but
+    each batch infers its own column types: a column that was all ints or
+    all nulls in the first batch may well carry floats later. When a batch's
+    types differ from the previous one, a fresh header-less writer picks up
+    on the same open file, so every cell is written in its own type.
+
+    The values match the stdlib path but the quoting does not: pyarrow
+    quotes every string cell (header included) where ``csv`` only quotes
+    cells that need it, and it has no equivalent of ``QUOTE_MINIMAL``. Any
+    CSV reader parses both files to the same rows.
+    """
+
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    fieldnames = None
+    columns = []
+    schema = None
+    writer = None
+
+    with open(out_path, "wb") as sink:
+
+        def write_batch():
+            nonlocal schema, writer
+            arrays = [_arrow_column(pa, col) for col in columns]
+            batch = pa.RecordBatch.from_arrays(arrays, names=list(fieldnames))
+            if writer is None or not batch.schema.equals(schema):
+                # Closing a writer leaves ``sink`` open for the next one.
+                if writer is not None:
+                    writer.close()
+                writer = pa_csv.CSVWriter(
+                    sink,
+                    batch.schema,
+                    write_options=pa_csv.WriteOptions(include_header=schema is None),
+                )
+                schema = batch.schema
+            writer.write_batch(batch)
+            for col in columns:
+                col.clear()
+
+        for row in rows:
+            if fieldnames is None:
+                fieldnames = tuple(row.keys())
+                fieldset = frozenset(fieldnames)
+                columns = [[] for _ in fieldnames]
+            if not row.keys() <= fieldset:
+                _check_columns(row, fieldnames)
+            for name, col in zip(fieldnames, columns):
+                col.append(row.get(name))
+            if len(columns[0]) >= batch_size:
+                write_batch()
+        if columns and columns[0]:
+            write_batch()
+        if writer is not None:
+            writer.close()
+
+
+def capture_stream(stdin, out_path, confirm_callback, use_arrow=False):
+    """Capture JSON rows from *stdin* and persist them to *out_path* as CSV.
+
+    *stdin* should be a binary stream (``sys.stdin.buffer``): both JSON
+    parsers take bytes directly, so lines skip a UTF-8 decode to ``str``
+    first. Text streams still work.
+
+    With ``use_arrow=True`` rows are collected into batches of
+    ``ARROW_BATCH_ROWS`` and encoded by pyarrow's C++ CSV writer; if pyarrow
+    is not installed the stdlib ``csv`` path below is used instead.
+    """
 
     if not confirm_callback(out_path):
         return False
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
+    if use_arrow:
+        try:
+            import pyarrow.csv  # noqa: F401
+        except ImportError:
+            print("# pyarrow not installed; writing with the csv module", file=sys.stderr)
+        else:
+            _write_arrow(_iter_rows(stdin), out_path, ARROW_BATCH_ROWS)
+            return True
+
     fieldnames = None
-    with open(out_path, "w", newline="") as f:
+    with open(out_path, "w", newline="", buffering=1 << 16) as f:
         writer = None
-        for line in stdin:
-            try:
-                row = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+        rows = 0
+        for row in _iter_rows(stdin):
             if fieldnames is None:
-                fieldnames = list(row.keys())
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-            writer.writerow(row)
-            f.flush()
+                # The first frame fixes the schema; later rows are written in
+                # that column order without DictWriter's per-row checks.
+                fieldnames = tuple(row.keys())
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                pick = itemgetter(*fieldnames)
+                if len(fieldnames) == 1:
+                    # itemgetter of one key returns the bare value, not a tuple.
+                    pick = lambda row, _get=pick: (_get(row),)  # noqa: E731
+            try:
+                # Frames from one firmware build carry the same keys, so a
+                # single C-level itemgetter call usually covers the whole row;
+                # with the same key count it then holds exactly the header keys.
+                values = pick(row)
+                exact = len(row) == len(fieldnames)
+            except KeyError:
+                exact = False
+            if not exact:
+                # Missing columns are left blank; extra ones are an error
+                # rather than silently dropped.
+                _check_columns(row, fieldnames)
+                values = [row.get(name, "") for name in fieldnames]
+            writer.writerow(values)
+            rows += 1
+            if rows % FLUSH_EVERY_ROWS == 0:
+                f.flush()
 
     return True
 
@@ -45,19 +234,29 @@ def capture_stream(stdin, out_path, confirm_callback):
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--file", required=True)
+    ap.add_argument(
+        "--arrow",
+        action="store_true",
+        help="encode rows in batches with pyarrow's CSV writer (falls back to csv)",
+    )
     args = ap.parse_args()
 
     out = Path(args.file)
+    stdin = sys.stdin.buffer
 
     def confirm_callback(path):
         print("This tool saves sensor frames to disk.")
-        ans = input(f"Save to {path}? Type YES to proceed: ").strip()
+        # Read the answer from the same binary buffer the frames come from;
+        # input() would go through sys.stdin's text layer, which can swallow
+        # frames piped in behind the answer.
+        print(f"Save to {path}? Type YES to proceed: ", end="", flush=True)
+        ans = stdin.readline().decode("utf-8", errors="replace").strip()
         if ans != "YES":
             print("Aborting without saving.")
             return False
         return True
 
-    capture_stream(sys.stdin, out, confirm_callback)
+    capture_stream(stdin, out, confirm_callback, use_arrow=args.arrow)
 
 if __name__ == "__main__":
     main()
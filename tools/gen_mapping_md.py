@@ -2,6 +2,7 @@
 #!/usr/bin/env python3
 """Generate ``docs/MAPPING_TABLE.md`` from the shared mapping YAML."""
 from pathlib import Path
+import io
 import sys
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -16,11 +17,12 @@ out_path = root / "docs" / "MAPPING_TABLE.md"
 
 m = load_mapping(mapping_path)
 axes_meta = m.get("axes", {})
-lines = []
-lines.append("# MAPPING TABLE (human‑readable)\n")
-lines.append("> Source features are normalized to 0–1. Curves are linear unless noted.\n\n")
-lines.append("| Sensor | Feature | Transform | Timbre Axis | Target Range | Notes |\n")
-lines.append("|---|---|---|---|---|---|\n")
+HEADER = (
+    "# MAPPING TABLE (human‑readable)\n",
+    "> Source features are normalized to 0–1. Curves are linear unless noted.\n\n",
+    "| Sensor | Feature | Transform | Timbre Axis | Target Range | Notes |\n",
+    "|---|---|---|---|---|---|\n",
+)
 
 def format_transform(feature_cfg: dict) -> str:
     if feature_cfg.get("doc_transform"):
@@ -56,26 +58,31 @@ def format_range(range_value, axis_info: dict, map_to: dict) -> str:
         return f"{lo} → {hi}{suffix}"
     return str(range_value)
 
-for sensor_key, sensor_cfg in m.get("sensors", {}).items():
-    sensor_label = sensor_cfg.get("label", sensor_key.replace("_", " ").title())
-    for feature_key, feature_cfg in sensor_cfg.get("features", {}).items():
-        feature_label = feature_cfg.get("label", feature_key.replace("_", " ").title())
-        map_to = feature_cfg.get("map_to", {})
-        axis_key = map_to.get("axis", "")
-        axis_info = axes_meta.get(axis_key, {})
-        axis_label = axis_info.get("label", axis_key.replace("_", " ").title())
-        target_range = format_range(map_to.get("range", ""), axis_info, map_to)
-        notes = feature_cfg.get("notes", axis_info.get("desc", ""))
-        lines.append(
-            "| {sensor} | {feature} | {transform} | {axis} | {target} | {notes} |\n".format(
-                sensor=sensor_label,
-                feature=feature_label,
-                transform=format_transform(feature_cfg),
-                axis=axis_label,
-                target=target_range,
-                notes=notes,
+def iter_rows():
+    """Yield one table row per feature; sensor and axis lookups happen once each."""
+
+    axis_cells = {}
+    for sensor_key, sensor_cfg in m.get("sensors", {}).items():
+        sensor_label = sensor_cfg.get("label", sensor_key.replace("_", " ").title())
+        for feature_key, feature_cfg in sensor_cfg.get("features", {}).items():
+            feature_label = feature_cfg.get("label", feature_key.replace("_", " ").title())
+            map_to = feature_cfg.get("map_to", {})
+            axis_key = map_to.get("axis", "")
+            cell = axis_cells.get(axis_key)
+            if cell is None:
+                info = axes_meta.get(axis_key, {})
+                label = info.get("label", axis_key.replace("_", " ").title())
+                cell = axis_cells[axis_key] = (info, label)
+            axis_info, axis_label = cell
+            target = format_range(map_to.get("range", ""), axis_info, map_to)
+            notes = feature_cfg.get("notes", axis_info.get("desc", ""))
+            yield (
+                f"| {sensor_label} | {feature_label} | {format_transform(feature_cfg)} "
+                f"| {axis_label} | {target} | {notes} |\n"
             )
-        )
 
-out_path.write_text("".join(lines))
+buf = io.StringIO()
+buf.writelines(HEADER)
+buf.writelines(iter_rows())
+out_path.write_text(buf.getvalue())
 print(f"Wrote {out_path}")